@@ -14,20 +14,330 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import array
+import functools
+import operator
+import re
+import struct
+import sys
+from collections import deque
+
+# Expression tokenizer: multi-char shift operators first, then single-char
+# operators, then operand runs (anything that is not whitespace or an operator).
+# One findall() call replaces the old per-character Python loop.
+_EXPR_TOKEN_RE = re.compile(r"<<|>>|[+\-*/&|^]|[^\s+\-*/&|^<>]+")
+
+# Quick "does this contain an operator at all" probe used to skip tokenization
+# for plain symbols and numeric literals
+_HAS_OPERATOR_RE = re.compile(r"<<|>>|[+\-*/&|^]")
+
+# Packers for whole-instruction stores: one C call writes opcode plus operand
+# (little-endian 16-bit for addr16, byte for imm8) instead of separate stores
+_PACK_BH = struct.Struct("<BH").pack_into
+_PACK_BB = struct.Struct("<BB").pack_into
+
+# Operator token -> C-level implementation, applied left-to-right with no
+# precedence (matching the original if/elif evaluation order)
+_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.floordiv,
+    "&": operator.and_,
+    "|": operator.or_,
+    "^": operator.xor,
+    "<<": operator.lshift,
+    ">>": operator.rshift,
+}
+
+
+# Instruction byte sizes keyed by mnemonic. Doubles as the valid-opcode set
+# (dict membership is a single hash probe instead of a linear list scan) and
+# replaces the long if/elif size cascade in the first pass.
+# Assembler directives (ORG, DS, END, EQU) are handled separately since they
+# do not occupy a fixed number of bytes.
+OPCODE_SIZES = {
+    # Data transfer
+    "MVI": 2,
+    "MOV": 1,
+    "LXI": 3,
+    "LDA": 3,
+    "STA": 3,
+    "LDAX": 1,
+    "STAX": 1,
+    "LHLD": 3,
+    "SHLD": 3,
+    "XCHG": 1,
+    # Arithmetic
+    "ADD": 1,
+    "ADI": 2,
+    "ADC": 1,
+    "ACI": 2,
+    "SUB": 1,
+    "SUI": 2,
+    "SBB": 1,
+    "SBI": 2,
+    "INR": 1,
+    "DCR": 1,
+    "INX": 1,
+    "DCX": 1,
+    "DAD": 1,
+    "DAA": 1,
+    # Logical
+    "ANA": 1,
+    "ANI": 2,
+    "ORA": 1,
+    "ORI": 2,
+    "XRA": 1,
+    "XRI": 2,
+    "CMP": 1,
+    "CPI": 2,
+    "CMA": 1,
+    "CMC": 1,
+    "STC": 1,
+    "RLC": 1,
+    "RRC": 1,
+    "RAL": 1,
+    "RAR": 1,
+    # Branching
+    "JMP": 3,
+    "JZ": 3,
+    "JNZ": 3,
+    "JC": 3,
+    "JNC": 3,
+    "JP": 3,
+    "JM": 3,
+    "JPE": 3,
+    "JPO": 3,
+    "CALL": 3,
+    "CC": 3,
+    "CNC": 3,
+    "CZ": 3,
+    "CNZ": 3,
+    "CP": 3,
+    "CM": 3,
+    "CPE": 3,
+    "CPO": 3,
+    "RET": 1,
+    "RC": 1,
+    "RNC": 1,
+    "RZ": 1,
+    "RNZ": 1,
+    "RP": 1,
+    "RM": 1,
+    "RPE": 1,
+    "RPO": 1,
+    "RST": 1,
+    "PCHL": 1,
+    # Stack and machine control
+    "PUSH": 1,
+    "POP": 1,
+    "SPHL": 1,
+    "XTHL": 1,
+    "IN": 2,
+    "OUT": 2,
+    "EI": 1,
+    "DI": 1,
+    "RIM": 1,
+    "SIM": 1,
+    "HLT": 1,
+    "NOP": 1,
+}
+
+# Assembler directives that are valid in source but generate no fixed-size opcode
+DIRECTIVES = frozenset(["DS", "ORG", "END", "EQU"])
+
+# Interned mnemonics and directives: tokenizer output is canonicalized against
+# this table so the many `opcode == "..."` comparisons against interned string
+# literals in the dispatch chain resolve by identity instead of character scans
+_INTERNED_OPCODES = {name: name for name in map(sys.intern, (*OPCODE_SIZES, *DIRECTIVES))}
+
+# Encode tables for the dispatch-driven single pass. Grouping is by operand
+# shape so one handler serves every mnemonic with the same encoding pattern.
+
+# Fixed one-byte instructions with no operand (includes conditional returns)
+_FIXED_BYTE_OPCODES = {
+    "HLT": 0x76,
+    "RET": 0xC9,
+    "XCHG": 0xEB,
+    "PCHL": 0xE9,
+    "SPHL": 0xF9,
+    "XTHL": 0xE3,
+    "CMA": 0x2F,
+    "CMC": 0x3F,
+    "STC": 0x37,
+    "RLC": 0x07,
+    "RRC": 0x0F,
+    "RAL": 0x17,
+    "RAR": 0x1F,
+    "DAA": 0x27,
+    "NOP": 0x00,
+    "EI": 0xFB,
+    "DI": 0xF3,
+    "RIM": 0x20,
+    "SIM": 0x30,
+    "RC": 0xD8,  # Return if carry
+    "RNC": 0xD0,  # Return if no carry
+    "RZ": 0xC8,  # Return if zero
+    "RNZ": 0xC0,  # Return if not zero
+    "RP": 0xF0,  # Return if positive (S=0)
+    "RM": 0xF8,  # Return if minus (S=1)
+    "RPE": 0xE8,  # Return if parity even
+    "RPO": 0xE0,  # Return if parity odd
+}
+
+# RST vector bytes indexed by restart number (0xC7 | n << 3 precomputed)
+_RST_OPCODES = (0xC7, 0xCF, 0xD7, 0xDF, 0xE7, 0xEF, 0xF7, 0xFF)
+
+# Every legal MOV encoding precomputed: one probe replaces two register-code
+# lookups and the arithmetic for the most common 8085 instruction. The illegal
+# MOV M,M slot (0x76 would collide with HLT) is deliberately absent.
+_MOV_TABLE = {
+    (dest, src): 0x40 + (di * 8) + si
+    for di, dest in enumerate("BCDEHLMA")
+    for si, src in enumerate("BCDEHLMA")
+    if not (dest == "M" and src == "M")
+}
+
+# One-byte register instructions encoded as base + (reg_code * multiplier)
+_REG_ARITH_BASES = {
+    "ADD": (0x80, 1),
+    "SUB": (0x90, 1),
+    "INR": (0x04, 8),
+    "DCR": (0x05, 8),
+}
+
+# One-byte ALU instructions encoded as base | reg_code
+_REG_LOGICAL_BASES = {
+    "ANA": 0xA0,
+    "ORA": 0xB0,
+    "XRA": 0xA8,
+    "ADC": 0x88,
+    "SBB": 0x98,
+    "CMP": 0xB8,
+}
+
+# One-byte register-pair instructions, fully encoded per (mnemonic, rp) so
+# the handler is a single probe with no rp-code lookup or multiply. PUSH/POP
+# get their PSW encodings as ordinary entries instead of a special case.
+_RP_ENCODED = {
+    (op, rp): base + (code * 16)
+    for op, base in (
+        ("INX", 0x03),
+        ("DCX", 0x0B),
+        ("DAD", 0x09),
+        ("PUSH", 0xC5),
+        ("POP", 0xC1),
+    )
+    for code, rp in enumerate(("B", "D", "H", "SP"))
+}
+_RP_ENCODED[("PUSH", "PSW")] = 0xF5
+_RP_ENCODED[("POP", "PSW")] = 0xF1
+
+# Two-byte instructions with an 8-bit immediate (or port) operand
+_IMMEDIATE_OPCODES = {
+    "ADI": 0xC6,
+    "ACI": 0xCE,
+    "SUI": 0xD6,
+    "SBI": 0xDE,
+    "ANI": 0xE6,
+    "XRI": 0xEE,
+    "ORI": 0xF6,
+    "CPI": 0xFE,
+    "IN": 0xDB,
+    "OUT": 0xD3,
+}
+
+# Three-byte instructions with a 16-bit address operand
+_ADDR_OPCODES = {
+    "LDA": 0x3A,
+    "STA": 0x32,
+    "LHLD": 0x2A,
+    "SHLD": 0x22,
+    "CALL": 0xCD,
+    "JMP": 0xC3,
+    "JZ": 0xCA,
+    "JNZ": 0xC2,
+    "JC": 0xDA,
+    "JNC": 0xD2,
+    "JP": 0xF2,
+    "JM": 0xFA,
+    "JPE": 0xEA,
+    "JPO": 0xE2,
+    "CC": 0xDC,  # Call if carry
+    "CNC": 0xD4,  # Call if no carry
+    "CZ": 0xCC,  # Call if zero
+    "CNZ": 0xC4,  # Call if not zero
+    "CP": 0xF4,  # Call if positive (S=0)
+    "CM": 0xFC,  # Call if minus (S=1)
+    "CPE": 0xEC,  # Call if parity even
+    "CPO": 0xE4,  # Call if parity odd
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _try_parse_number(value_str):
+    """
+    Parse a numeric literal ('H'-suffixed hexadecimal, 'B'-suffixed binary,
+    or decimal), returning None instead of raising on failure so hot
+    resolution paths can stay exception-free. Pure string-to-int work, so
+    results are memoized - large sources repeat the same immediates
+    constantly.
+    """
+    if not value_str:
+        return None
+    # Classify on the last character instead of allocating an uppercased
+    # copy of every literal just to run endswith
+    last = value_str[-1]
+    try:
+        if last == "H" or last == "h":
+            return int(value_str[:-1], 16)
+        if last == "B" or last == "b":
+            return int(value_str[:-1], 2)
+        return int(value_str, 10)
+    except ValueError:
+        return None
+
 
 class AssemblyOutput:
     """Container for the results of assembly process"""
 
+    # Fixed attribute layout: slot access skips the per-instance dict, which
+    # matters for the fields the emit handlers touch on every instruction
+    __slots__ = (
+        "memory",
+        "mem",
+        "parsed_program",
+        "line_to_address_map",
+        "address_to_line_map",
+        "labels",
+        "symbols",
+        "program_end_address",
+        "program_memory_flags",
+        "data_memory_flags",
+        "starting_address",
+    )
+
     def __init__(self):
         self.memory = bytearray(0x10000)  # 64KB memory space
+        # Writable view over memory: emitters index and slice through this to
+        # skip the bytearray per-store resize check, and 16-bit operands go in
+        # as one little-endian slice write
+        self.mem = memoryview(self.memory)
         self.parsed_program = []
         self.line_to_address_map = {}
-        self.address_to_line_map = {}
+        # Flat per-address line table instead of a dict: stepping reads it
+        # densely, and an array gives O(1) indexed reads with no per-entry
+        # hash overhead. -1 marks addresses that belong to no source line.
+        self.address_to_line_map = array.array("i", [-1]) * 0x10000
         self.labels = {}
         self.symbols = {}  # Store EQU symbol definitions
         self.program_end_address = 0
-        self.program_memory_range = set()  # Code addresses (protected)
-        self.data_memory_range = set()  # DS addresses (writable)
+        # One flag byte per address instead of a set of ints: membership is a
+        # single index, bulk marking is a slice assignment, and memory cost is
+        # a flat 64KB per map rather than hash-table overhead per entry
+        self.program_memory_flags = bytearray(0x10000)  # Code addresses (protected)
+        self.data_memory_flags = bytearray(0x10000)  # DS addresses (writable)
         self.starting_address = 0x0000
 
 
@@ -38,95 +348,52 @@ class Assembler8085:
     """
 
     def __init__(self):
-        # Instruction metadata
-        self.valid_opcodes = [
-            "MVI",
-            "MOV",
-            "LXI",
-            "LDA",
-            "STA",
-            "ADD",
-            "ADI",
-            "SUB",
-            "INR",
-            "DCR",
-            "JMP",
-            "JZ",
-            "JNZ",
-            "JC",
-            "JNC",
-            "JP",
-            "JM",
-            "JPE",
-            "JPO",
-            "HLT",
-            "INX",
-            "PUSH",
-            "POP",
-            "CALL",
-            "RET",
-            "CPI",
-            "DAD",
-            "XCHG",
-            "DS",
-            "ORG",
-            "END",
-            "EQU",
-            "LDAX",
-            "STAX",
-            "LHLD",
-            "SHLD",
-            "PCHL",
-            "SPHL",
-            "XTHL",
-            "ANA",
-            "ANI",
-            "ORA",
-            "ORI",
-            "XRA",
-            "XRI",
-            "CMA",
-            "CMC",
-            "STC",
-            "RLC",
-            "RRC",
-            "RAL",
-            "RAR",
-            "ADC",
-            "ACI",
-            "SBB",
-            "SBI",
-            "DAA",
-            "DCX",
-            "CC",
-            "CNC",
-            "CZ",
-            "CNZ",
-            "CP",
-            "CM",
-            "CPE",
-            "CPO",
-            "RC",
-            "RNC",
-            "RZ",
-            "RNZ",
-            "RP",
-            "RM",
-            "RPE",
-            "RPO",
-            "RST",
-            "CMP",
-            "NOP",
-            "SUI",
-            "IN",
-            "OUT",
-            "EI",
-            "DI",
-            "RIM",
-            "SIM",
-        ]
+        # Instruction metadata - OPCODE_SIZES doubles as the valid mnemonic set
+        self.valid_opcodes = OPCODE_SIZES
         self.valid_registers = ["B", "C", "D", "E", "H", "L", "M", "A"]
         self.valid_register_pairs = ["B", "D", "H", "SP"]
+        # Code lookups as dicts: one hash probe instead of a membership test
+        # plus a linear .index() scan per register-bearing instruction
+        self._reg_code = {reg: i for i, reg in enumerate(self.valid_registers)}
+        self._rp_code = {rp: i for i, rp in enumerate(self.valid_register_pairs)}
+
+        # Encode dispatch: maps each mnemonic to its bound handler so the
+        # single pass does one hash lookup per instruction instead of walking
+        # an if/elif chain of string comparisons
+        self._emit_dispatch = {}
+        for table, handler in (
+            (_FIXED_BYTE_OPCODES, self._emit_fixed),
+            (_REG_ARITH_BASES, self._emit_reg_arith),
+            (_REG_LOGICAL_BASES, self._emit_reg_logical),
+            (("INX", "DCX", "DAD", "PUSH", "POP"), self._emit_rp_op),
+            (_IMMEDIATE_OPCODES, self._emit_immediate),
+            (_ADDR_OPCODES, self._emit_addr),
+        ):
+            for op in table:
+                self._emit_dispatch[op] = handler
+        self._emit_dispatch.update(
+            MVI=self._emit_mvi,
+            MOV=self._emit_mov,
+            LXI=self._emit_lxi,
+            LDAX=self._emit_ldax,
+            STAX=self._emit_stax,
+            RST=self._emit_rst,
+        )
+
+        # Expression caches: the EQU fix-point loop and the two passes evaluate
+        # the same expression strings repeatedly. Token lists never change for
+        # a given expression; resolved values are only valid for the symbol
+        # tables they were computed against, so the value cache is flushed
+        # whenever output.symbols/output.labels gain entries.
+        self._expr_token_cache = {}
+        self._expr_value_cache = {}
+        self._expr_cache_version = (-1, -1)
+
+        # Whole-line encoding cache, reset per assemble() run: repeated lines
+        # like MOV A, B copy their previously encoded bytes instead of
+        # re-running the handler. Only encodings that completed without
+        # deferring a fixup are cached (see _single_pass).
+        self._enc_cache = {}
 
     def assemble(self, code):
         """
@@ -148,8 +415,8 @@ class Assembler8085:
                 - labels: Dictionary of label names to their addresses
                 - symbols: Dictionary of EQU symbol names to their values
                 - program_end_address: End address of the assembled program
-                - program_memory_range: Set of addresses containing program code
-                - data_memory_range: Set of addresses containing data
+                - program_memory_flags: Per-address flags marking program code
+                - data_memory_flags: Per-address flags marking data
                 - starting_address: Beginning address of the program
 
         Raises:
@@ -157,77 +424,174 @@ class Assembler8085:
         """
         output = AssemblyOutput()
 
-        # Convert program to uppercase for consistent parsing
-        uppercase_code = []
-        for line in code:
-            uppercase_code.append(line.upper())
+        # Resolved expression values are only meaningful against this run's
+        # symbol tables, so the value cache starts every run empty; the token
+        # cache is a pure function of the expression text and persists
+        self._expr_value_cache.clear()
+        self._expr_cache_version = (-1, -1)
 
-        code = uppercase_code
+        # Tokenize the source once; every subsequent pass consumes these
+        # records instead of re-splitting and re-stripping the raw text
+        lines = self._tokenize_source(code)
 
         # Special pre-pass: Process all EQU directives first
-        self._preprocess_equ_directives(code, output)
+        self._preprocess_equ_directives(lines, output)
 
-        # First pass: Find labels and validate syntax
-        self._first_pass(code, output)
+        # Single pass: collect labels, validate syntax, and generate machine
+        # code, deferring forward references to the fixup list
+        self._single_pass(lines, output)
 
-        # Resolve any EQU directives that depend on labels from first pass
-        self._resolve_pending_equs(code, output)
+        # Resolve any EQU directives that depend on labels from the main pass
+        self._resolve_pending_equs(output)
 
-        # Second pass: Build program, resolve labels, and generate machine code
-        self._second_pass(code, output)
+        # Patch placeholder bytes emitted for forward references now that
+        # every label and symbol is known
+        self._apply_fixups(output)
 
         return output
 
-    def _preprocess_equ_directives(self, code, output):
+    def _tokenize_source(self, code):
         """
-        Pre-process to handle all EQU directives with support for nested definitions
-        and arithmetic operations
+        Single tokenization pass over the raw source. Strips comments,
+        uppercases, splits each line into whitespace-delimited tokens, and
+        separates any leading label so the EQU pre-pass and both assembly
+        passes can share one token stream instead of re-parsing the text.
+
+        Args:
+            code (list): Raw assembly source lines
+
+        Returns:
+            list: (line_num, label, tokens, display_tokens) records for each
+                non-blank line, where label is None when absent, tokens
+                excludes the label and has operand punctuation stripped, and
+                display_tokens keeps the original operand form (the same list
+                object when nothing was stripped)
+
+        Raises:
+            SyntaxError: If a label contains stray colons
         """
-        # First, collect all EQU definitions
-        equ_definitions = []
+        records = []
         for line_num, line in enumerate(code, 1):
-            line = line.split(";", 1)[0].strip()  # Remove comments
-            if not line:
+            parts = line.split(";", 1)[0].upper().split()  # Remove comments
+            if not parts:
                 continue
 
-            parts = line.split()
-            if len(parts) >= 3 and "EQU" in parts:
-                equ_idx = parts.index("EQU")
-                if equ_idx > 0:  # Must have a symbol before EQU
-                    symbol = parts[0]
-                    if symbol.endswith(":"):  # Remove colon if present
-                        symbol = symbol[:-1]
-                    value_expr = " ".join(parts[equ_idx + 1 :])
-                    equ_definitions.append((symbol, value_expr, line_num))
-
-        # Process EQU definitions in order, resolving dependencies
-        processed = set()
-        while equ_definitions:
-            progress = False
-            remaining = []
-
-            for symbol, value_expr, line_num in equ_definitions:
-                # Try to evaluate the expression
-                value = self._evaluate_expression(value_expr, output, line_num)
+            label = None
 
-                if value is not None:  # Successfully evaluated
-                    output.symbols[symbol] = value & 0xFFFF  # Ensure 16-bit value
-                    processed.add(symbol)
-                    progress = True
+            head, sep, tail = parts[0].partition(":")
+            if sep:
+                if ":" in tail:
+                    raise SyntaxError(
+                        f"Line {line_num}: Invalid label format: {parts[0]}"
+                    )
+                label = head
+                if tail:
+                    # Label combined with instruction (LABEL:INSTR)
+                    tokens = [tail] + parts[1:]
                 else:
-                    remaining.append((symbol, value_expr, line_num))
-
-            if not progress and remaining:
-                # Could not make progress in resolving symbols
-                # Save unresolved EQUs for later resolution after first pass
-                self._pending_equs = remaining
-                return
+                    tokens = parts[1:]
+            else:
+                tokens = parts
 
-            equ_definitions = remaining
+            display_tokens = tokens
+            if tokens:
+                tokens[0] = _INTERNED_OPCODES.get(tokens[0], tokens[0])
+                # Rejoin whitespace-split expression operands here so every
+                # consumer of the records sees the final token form and no
+                # later stage reparses the strings
+                # e.g., ["STA", "DATA_AREA", "+", "1"] -> ["STA", "DATA_AREA + 1"]
+                tokens = self._join_expression_tokens(tokens)
+                # Strip operand punctuation once here so handlers receive
+                # clean operand strings instead of re-stripping per branch;
+                # the pre-strip form is kept so display text (execution log
+                # lines, last_instruction) retains its commas
+                display_tokens = tokens
+                for i in range(1, len(tokens)):
+                    stripped = tokens[i].strip(",;")
+                    if stripped != tokens[i]:
+                        if tokens is display_tokens:
+                            tokens = display_tokens[:]
+                        tokens[i] = stripped
+            records.append((line_num, label, tokens, display_tokens))
+
+        return records
+
+    def _preprocess_equ_directives(self, lines, output):
+        """
+        Pre-process to handle all EQU directives with support for nested definitions
+        and arithmetic operations
+        """
+        # First, collect all EQU definitions
+        equ_definitions = []
+        for line_num, label, tokens, _ in lines:
+            if "EQU" not in tokens:
+                continue
 
-        self._pending_equs = []
+            equ_idx = tokens.index("EQU")
+            if label is not None and equ_idx == 0:
+                # SYMBOL: EQU expr
+                symbol = label
+            elif equ_idx > 0:
+                # SYMBOL EQU expr - must have a symbol before EQU
+                symbol = tokens[0]
+            else:
+                continue
 
-    def _resolve_pending_equs(self, code, output):
+            value_expr = " ".join(tokens[equ_idx + 1 :])
+            if value_expr:
+                equ_definitions.append((symbol, value_expr, line_num))
+
+        # Process definitions in dependency order: build the graph of which
+        # EQUs reference which and walk it with Kahn's algorithm, so deeply
+        # chained definitions resolve in one linear sweep instead of the old
+        # retry-until-no-progress loop (quadratic in the chain depth)
+        symbol_indices = {}
+        for idx, (symbol, _, _) in enumerate(equ_definitions):
+            symbol_indices.setdefault(symbol, []).append(idx)
+
+        dependents = [[] for _ in equ_definitions]
+        dep_counts = [0] * len(equ_definitions)
+        for idx, (symbol, value_expr, _) in enumerate(equ_definitions):
+            for token in self._tokenize_expression(value_expr):
+                for def_idx in symbol_indices.get(token, ()):
+                    if def_idx != idx:
+                        dependents[def_idx].append(idx)
+                        dep_counts[idx] += 1
+
+        ready = deque(idx for idx, count in enumerate(dep_counts) if count == 0)
+        unresolved = []
+        ordered_count = 0
+        while ready:
+            idx = ready.popleft()
+            ordered_count += 1
+
+            symbol, value_expr, line_num = equ_definitions[idx]
+            value = self._evaluate_expression(value_expr, output, line_num)
+
+            if value is not None:  # Successfully evaluated
+                output.symbols[symbol] = value & 0xFFFF  # Ensure 16-bit value
+            else:
+                # Depends on a label only known after the main pass
+                unresolved.append((symbol, value_expr, line_num))
+
+            for dep_idx in dependents[idx]:
+                dep_counts[dep_idx] -= 1
+                if dep_counts[dep_idx] == 0:
+                    ready.append(dep_idx)
+
+        if ordered_count != len(equ_definitions):
+            # Definitions left outside the topological order form a cycle;
+            # save them with the label-dependent ones for the later retry
+            unresolved.extend(
+                equ_definitions[idx]
+                for idx, count in enumerate(dep_counts)
+                if count > 0
+            )
+
+        # Save unresolved EQUs for resolution after the main pass
+        self._pending_equs = unresolved
+
+    def _resolve_pending_equs(self, output):
         """
         Resolve EQU directives that depend on labels discovered during the first pass.
         Called after _first_pass when all labels (from DS, code positions, etc.) are known.
@@ -277,58 +641,40 @@ class Assembler8085:
         Raises:
             SyntaxError: If the expression syntax is invalid
         """
+        # Fast path: a plain decimal immediate is the most common operand form
+        # and needs no cache, comment stripping, or tokenizer involvement
+        if expr.isdigit():
+            return int(expr, 10)
+
         # Remove any comments that might be present in the expression
         if ";" in expr:
             expr = expr.split(";", 1)[0].strip()
 
-        # Simple case: direct symbol or number with no operators
-        if not any(
-            op in expr for op in ["*", "/", "+", "-", "&", "|", "^", "<<", ">>"]
-        ):
-            return self._resolve_symbol_or_value(expr, output)
-
-        # Tokenize the expression into operands and operators
-        tokens = []
-        current_token = ""
-        operators = ["*", "/", "+", "-", "&", "|", "^"]  # Single-char operators
-        multi_char_operators = ["<<", ">>"]
-
-        # Parse the expression character by character, separating operands and operators
-        i = 0
-        while i < len(expr):
-            # Skip whitespace between tokens
-            if expr[i].isspace():
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-                i += 1
-                continue
+        # Cached values are only valid against the symbol/label tables they
+        # were computed with - flush when either table has grown, since a
+        # previously-unresolvable expression may now resolve
+        version = (len(output.symbols), len(output.labels))
+        if version != self._expr_cache_version:
+            self._expr_value_cache.clear()
+            self._expr_cache_version = version
 
-            # Check for multi-character operators (<<, >>)
-            if i < len(expr) - 1 and expr[i : i + 2] in multi_char_operators:
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-                tokens.append(expr[i : i + 2])
-                i += 2
-                continue
+        cached_value = self._expr_value_cache.get(expr)
+        if cached_value is not None:
+            return cached_value
 
-            # Check for single-character operators (+, -, *, /, &, |, ^)
-            if expr[i] in operators:
-                if current_token:
-                    tokens.append(current_token)
-                    current_token = ""
-                tokens.append(expr[i])
-                i += 1
-                continue
-
-            # Add to current token (part of an operand)
-            current_token += expr[i]
-            i += 1
+        # Simple case: direct symbol or number with no operators
+        if not _HAS_OPERATOR_RE.search(expr):
+            result = self._resolve_symbol_or_value(expr, output)
+            if result is not None:
+                self._expr_value_cache[expr] = result
+            return result
 
-        # Add final token if any remains
-        if current_token:
-            tokens.append(current_token)
+        # Tokenize the expression into operands and operators; token lists are
+        # independent of the symbol tables, so they are cached unconditionally
+        tokens = self._expr_token_cache.get(expr)
+        if tokens is None:
+            tokens = self._tokenize_expression(expr)
+            self._expr_token_cache[expr] = tokens
 
         # Simple validation - we need at least one operand
         if len(tokens) < 3:
@@ -337,316 +683,79 @@ class Assembler8085:
                 return self._resolve_symbol_or_value(tokens[0], output)
             return None
 
-        # Evaluate the expression from left to right (no operator precedence)
-        result = self._resolve_symbol_or_value(tokens[0], output)
+        # Evaluate the expression from left to right (no operator precedence).
+        # This fold is the hottest loop in expression-heavy assembly, so the
+        # per-token resolution is inlined here with the dictionary lookups
+        # bound to locals rather than going through _resolve_symbol_or_value
+        symbols_get = output.symbols.get
+        labels_get = output.labels.get
+        ops_get = _OPS.get
+
+        token = tokens[0]
+        result = symbols_get(token)
+        if result is None:
+            result = labels_get(token)
+        if result is None:
+            result = _try_parse_number(token)
 
         # If we can't resolve the first operand, can't evaluate the expression
         if result is None:
             return None
 
         # Apply each operator with left-to-right evaluation
-        for i in range(1, len(tokens), 2):
-            if i + 1 >= len(tokens):
-                break  # No more operands
+        for i in range(1, len(tokens) - 1, 2):
+            op_func = ops_get(tokens[i])
 
-            operator = tokens[i]
-            operand_str = tokens[i + 1]
+            # Unknown operator token - expression is malformed
+            if op_func is None:
+                return None
 
             # Resolve the operand (could be a symbol or number)
-            operand = self._resolve_symbol_or_value(operand_str, output)
+            token = tokens[i + 1]
+            operand = symbols_get(token)
+            if operand is None:
+                operand = labels_get(token)
+            if operand is None:
+                operand = _try_parse_number(token)
 
             # If we can't resolve this operand, we can't evaluate further
             if operand is None:
                 return None
 
             # Apply the operator to accumulate the result
-            if operator == "+":
-                result += operand
-            elif operator == "-":
-                result -= operand
-            elif operator == "*":
-                result *= operand
-            elif operator == "/":
-                result //= operand  # Integer division
-            elif operator == "&":
-                result &= operand  # Bitwise AND
-            elif operator == "|":
-                result |= operand  # Bitwise OR
-            elif operator == "^":
-                result ^= operand  # Bitwise XOR
-            elif operator == "<<":
-                result <<= operand  # Bit shift left
-            elif operator == ">>":
-                result >>= operand  # Bit shift right
+            result = op_func(result, operand)
 
+        if result is not None:
+            self._expr_value_cache[expr] = result
         return result
 
-    def _resolve_symbol_or_value(self, value_str, output):
+    def _tokenize_expression(self, expr):
         """
-        Try to resolve a symbol or parse a value. Returns None if symbol not found.
+        Split an expression string into a flat list of operand and operator
+        tokens. Pure function of the expression text, so results are cached
+        in _expr_token_cache by the caller.
         """
-        value_str = value_str.strip()
-
-        # Check if it's a symbol (EQU-defined)
-        if value_str in output.symbols:
-            return output.symbols[value_str]
+        return _EXPR_TOKEN_RE.findall(expr)
 
-        # Check if it's a label (from first pass)
-        if value_str in output.labels:
-            return output.labels[value_str]
-
-        # Otherwise try to parse as a number
-        try:
-            return self._parse_number(value_str)
-        except ValueError:
-            return None
-
-    def _first_pass(self, code, output):
+    def _resolve_symbol_or_value(self, value_str, output):
         """
-        First pass of assembly process - validates syntax and collects labels
-
-        Args:
-            code (list): Assembly code lines
-            output (AssemblyOutput): Output container to store results
-
-        Raises:
-            SyntaxError: If there are syntax errors in the code
+        Try to resolve a symbol or parse a value. Returns None if symbol not found.
         """
-        address = 0x0000
-        first_org_seen = False
-
-        for line_num, line in enumerate(code, 1):
-            original_line = line
-            line = line.split(";", 1)[0].strip()  # Remove comments
-            if not line:
-                continue
-
-            # Check for labels
-            parts = line.split()
-            label = None
-
-            if ":" in parts[0]:
-                label_part = parts[0]
-                if label_part.endswith(":"):
-                    label = label_part[:-1]
-                else:
-                    # Label might be combined with instruction (LABEL:INSTR)
-                    label_parts = label_part.split(":")
-                    if len(label_parts) == 2:
-                        label = label_parts[0]
-                        # Reconstruct the line without the label
-                        parts[0] = label_parts[1]
-                        line = " ".join(parts)
-                    else:
-                        raise SyntaxError(
-                            f"Line {line_num}: Invalid label format: {label_part}"
-                        )
-
-                if label:
-                    if label in output.labels:
-                        raise SyntaxError(f"Line {line_num}: Duplicate label: {label}")
-                    output.labels[label] = address
-
-            # Skip if line only contains a label
-            if not parts or (len(parts) == 1 and parts[0].endswith(":")):
-                continue
-
-            # Get instruction/directive
-            instruction = parts[0] if not parts[0].endswith(":") else parts[1]
-
-            if instruction not in self.valid_opcodes:
-                # Check if the instruction is combined with the label
-                if ":" in instruction:
-                    instr_parts = instruction.split(":")
-                    if len(instr_parts) == 2 and instr_parts[1] in self.valid_opcodes:
-                        instruction = instr_parts[1]
-                    else:
-                        raise SyntaxError(
-                            f"Line {line_num}: Invalid instruction: {instruction}"
-                        )
-                else:
-                    raise SyntaxError(
-                        f"Line {line_num}: Unknown instruction: {instruction}"
-                    )
-
-            # Handle ORG directive
-            if instruction == "ORG":
-                if len(parts) < 2:
-                    raise SyntaxError(f"Line {line_num}: ORG requires an address")
-
-                try:
-                    org_address = self._parse_number(parts[1])
-                    address = org_address
-
-                    if not first_org_seen:
-                        output.starting_address = address
-                        first_org_seen = True
-                except ValueError:
-                    raise SyntaxError(
-                        f"Line {line_num}: Invalid ORG address: {parts[1]}"
-                    )
+        value_str = value_str.strip()
 
-                continue  # ORG doesn't generate code
+        # Check if it's a symbol (EQU-defined); a single hash probe each, and
+        # explicit None checks since 0 is a valid value
+        value = output.symbols.get(value_str)
+        if value is not None:
+            return value
 
-            # Handle DS (Define Storage) directive
-            if instruction == "DS":
-                # Adjust for tokens layout based on label presence
-                instruction_index = 0
-                if parts[0].endswith(":"):
-                    instruction_index = 1
-                size_index = instruction_index + 1
+        # Check if it's a label (collected during the main pass)
+        value = output.labels.get(value_str)
+        if value is not None:
+            return value
 
-                if len(parts) <= size_index:
-                    raise SyntaxError(f"Line {line_num}: DS requires a size")
-
-                try:
-                    # Join remaining parts as potential expression
-                    size_expr = " ".join(parts[size_index:])
-                    # Remove any trailing comments (already stripped above, but be safe)
-                    size_expr = size_expr.split(";")[0].strip()
-
-                    # Try to resolve as symbol first
-                    if size_expr in output.symbols:
-                        size = output.symbols[size_expr]
-                    else:
-                        # Try evaluate as expression (handles "10 + 5", "CONST * 2", etc.)
-                        result = self._evaluate_expression(size_expr, output, line_num)
-                        if result is not None:
-                            size = result
-                        else:
-                            size = self._parse_number(size_expr)
-
-                    # Mark as data memory (writable), not program memory (protected)
-                    for i in range(size):
-                        output.data_memory_range.add(address + i)
-
-                    address += size
-                except ValueError as e:
-                    raise SyntaxError(
-                        f"Line {line_num}: Invalid DS size: {size_expr}"
-                    )
-                continue  # DS doesn't generate code
-
-            # Handle END directive
-            if instruction == "END":
-                break  # End of assembly
-
-            # Skip EQU directives in first pass (already processed)
-            if instruction == "EQU":
-                continue
-
-            # Map the line to the current address
-            output.line_to_address_map[line_num] = address
-            output.address_to_line_map[address] = line_num
-
-            # Calculate instruction size and advance address
-            if (
-                instruction == "MVI" or instruction == "ADI" or instruction == "CPI"
-            ):  # 2 bytes
-                address += 2
-            elif (
-                instruction == "LXI"
-                or instruction == "LDA"
-                or instruction == "STA"
-                or instruction == "JMP"
-                or instruction == "JZ"
-                or instruction == "JNZ"
-                or instruction == "JC"
-                or instruction == "JNC"
-                or instruction == "JP"
-                or instruction == "JM"
-                or instruction == "JPE"
-                or instruction == "JPO"
-                or instruction == "CALL"
-            ):  # 3 bytes
-                address += 3
-            elif (
-                instruction == "MOV"
-                or instruction == "ADD"
-                or instruction == "SUB"
-                or instruction == "INR"
-                or instruction == "DCR"
-                or instruction == "HLT"
-                or instruction == "INX"
-                or instruction == "DAD"
-                or instruction == "XCHG"
-                or instruction == "PUSH"
-                or instruction == "POP"
-                or instruction == "RET"
-            ):  # 1 byte
-                address += 1
-            elif (
-                instruction == "LDAX"
-                or instruction == "STAX"
-                or instruction == "PCHL"
-                or instruction == "SPHL"
-                or instruction == "XTHL"
-            ):  # 1 byte
-                address += 1
-            elif (
-                instruction == "LHLD" or instruction == "SHLD"
-            ):  # 3 bytes (opcode + address)
-                address += 3
-            elif instruction in ["ANA", "ORA", "XRA"]:  # 1 byte (with register operand)
-                address += 1
-            elif instruction in [
-                "ANI",
-                "ORI",
-                "XRI",
-            ]:  # 2 bytes (with immediate operand)
-                address += 2
-            elif instruction in [
-                "CMA",
-                "CMC",
-                "STC",
-                "RLC",
-                "RRC",
-                "RAL",
-                "RAR",
-            ]:  # 1 byte (no operands)
-                address += 1
-            elif instruction in ["ADC", "SBB"]:  # 1 byte (with register operand)
-                address += 1
-            elif instruction in ["ACI", "SBI"]:  # 2 bytes (with immediate operand)
-                address += 2
-            elif instruction in ["DAA"]:  # 1 byte (no operands)
-                address += 1
-            elif instruction == "DCX":  # 1 byte (with register pair operand)
-                address += 1
-            elif instruction in [
-                "CC",
-                "CNC",
-                "CZ",
-                "CNZ",
-                "CP",
-                "CM",
-                "CPE",
-                "CPO",
-            ]:  # 3 bytes (conditional calls)
-                address += 3
-            elif instruction in [
-                "RC",
-                "RNC",
-                "RZ",
-                "RNZ",
-                "RP",
-                "RM",
-                "RPE",
-                "RPO",
-            ]:  # 1 byte (conditional returns)
-                address += 1
-            elif instruction == "RST":  # 1 byte (restart)
-                address += 1
-            elif instruction == "CMP":  # 1 byte
-                address += 1
-            elif instruction == "NOP":  # 1 byte (no operands)
-                address += 1
-            elif instruction == "SUI":  # 2 bytes (opcode + immediate)
-                address += 2
-            elif instruction in ["IN", "OUT"]:  # 2 bytes (opcode + port)
-                address += 2
-            elif instruction in ["EI", "DI", "RIM", "SIM"]:  # 1 byte
-                address += 1
+        # Otherwise try to parse as a number without raising
+        return _try_parse_number(value_str)
 
     def _resolve_symbol_or_number(self, value_str, output):
         """
@@ -666,24 +775,72 @@ class Assembler8085:
         value_str = value_str.strip()
 
         # Check if it's a symbol
-        if value_str in output.symbols:
-            return output.symbols[value_str]
+        value = output.symbols.get(value_str)
+        if value is not None:
+            return value
 
         # If not a symbol, check if it's a label
-        if value_str in output.labels:
-            return output.labels[value_str]
+        value = output.labels.get(value_str)
+        if value is not None:
+            return value
 
         # Check if it contains an arithmetic expression
-        if any(op in value_str for op in ["+", "-", "*", "/", "&", "|", "^", "<<", ">>"]):
+        if _HAS_OPERATOR_RE.search(value_str):
             result = self._evaluate_expression(value_str, output, 0)
             if result is not None:
                 return result
 
         # Otherwise try to parse as a number
+        value = _try_parse_number(value_str)
+        if value is None:
+            raise ValueError(f"Could not resolve value: {value_str}")
+        return value
+
+    def _resolve_or_defer(self, value_str, output, operand_addr, line_num, size):
+        """
+        Resolves an operand immediately when possible; otherwise records a
+        fixup so the placeholder bytes at operand_addr can be patched after
+        the single pass, when forward-referenced labels are known.
+
+        Args:
+            value_str (str): The operand string to resolve
+            output (AssemblyOutput): The output container with symbol tables
+            operand_addr (int): Memory address of the operand's first byte
+            line_num (int): Source line number for error reporting
+            size (int): Operand width in bytes (1 or 2)
+
+        Returns:
+            int: The resolved value, or 0 as a placeholder for deferred operands
+        """
         try:
-            return self._parse_number(value_str)
+            return self._resolve_symbol_or_number(value_str, output)
         except ValueError:
-            raise ValueError(f"Could not resolve value: {value_str}")
+            self._fixups.append((operand_addr, value_str, line_num, size))
+            return 0
+
+    def _apply_fixups(self, output):
+        """
+        Patches placeholder operand bytes recorded during the single pass.
+        Runs after all labels and pending EQU symbols have been collected,
+        so any operand that still fails to resolve is a genuine error.
+
+        Raises:
+            SyntaxError: If a deferred operand cannot be resolved
+        """
+        for operand_addr, value_str, line_num, size in self._fixups:
+            try:
+                value = self._resolve_symbol_or_number(value_str, output)
+            except ValueError as e:
+                raise SyntaxError(f"Line {line_num}: {str(e)}")
+
+            if size == 2:
+                output.mem[operand_addr : operand_addr + 2] = (value & 0xFFFF).to_bytes(
+                    2, "little"
+                )
+            else:
+                output.mem[operand_addr] = value & 0xFF
+
+        self._fixups = []
 
     def _join_expression_tokens(self, tokens):
         """
@@ -718,87 +875,97 @@ class Assembler8085:
 
         return tokens
 
-    def _second_pass(self, code, output):
+    def _single_pass(self, lines, output):
         """
-        Second pass - generate machine code and build program structures
+        Single assembly pass - collects labels, validates syntax, and
+        generates machine code from the pre-tokenized (line_num, label,
+        tokens) records. Operands that reference labels not yet defined are
+        emitted as placeholder bytes and recorded in the fixup list, which
+        _apply_fixups patches once the whole program has been scanned.
+
+        Raises:
+            SyntaxError: If there are syntax errors in the code
         """
         address = 0x0000
-        for line_num, line in enumerate(code, 1):
-            line = line.split(";", 1)[0].strip()  # Remove comments
-            if not line:
-                continue
-
-            # Skip lines with only labels
-            parts = line.split()
-            if not parts:
-                continue
-
-            # Handle label-only lines
-            if len(parts) == 1 and parts[0].endswith(":"):
+        first_org_seen = False
+        self._fixups = []
+        self._enc_cache = {}
+        enc_cache = self._enc_cache
+        fixups = self._fixups
+
+        # Bind the per-line lookups to locals: each name below is touched for
+        # every source line, and local loads are cheaper than attribute chains
+        mem = output.mem
+        labels = output.labels
+        program_flags = output.program_memory_flags
+        line_to_address_map = output.line_to_address_map
+        address_to_line_map = output.address_to_line_map
+        parsed_program_append = output.parsed_program.append
+        emit_dispatch = self._emit_dispatch
+        fixed_byte_get = _FIXED_BYTE_OPCODES.get
+
+        for line_num, label, tokens, display_tokens in lines:
+            # EQU lines bind their name as a symbol in the pre-pass, not as a
+            # positional label; registering the name here would let operands
+            # resolve it to the current address before the pending EQU value
+            # is known
+            if label and not (tokens and tokens[0] == "EQU"):
+                if label in labels:
+                    raise SyntaxError(f"Line {line_num}: Duplicate label: {label}")
+                labels[label] = address
+
+            # Skip label-only lines
+            if not tokens:
                 continue
 
-            # Extract instruction, handling labels
-            tokens = []
-            if ":" in parts[0]:
-                if parts[0].endswith(":"):  # Label is separate
-                    if len(parts) == 1:
-                        continue  # Label-only line
-                    tokens = parts[1:]  # Skip the label
-                else:  # Label is combined with instruction
-                    label_parts = parts[0].split(":")
-                    if len(label_parts) == 2:
-                        tokens = [label_parts[1]] + parts[1:]
-                    else:
-                        continue  # Malformed line (error caught in first pass)
-            else:
-                tokens = parts
-
             opcode = tokens[0]
 
-            # Join expression tokens split by whitespace
-            # e.g., ["STA", "DATA_AREA", "+", "1"] -> ["STA", "DATA_AREA + 1"]
-            tokens = self._join_expression_tokens(tokens)
+            if opcode not in OPCODE_SIZES and opcode not in DIRECTIVES:
+                raise SyntaxError(f"Line {line_num}: Unknown instruction: {opcode}")
 
-            # Skip EQU directives
+            # Skip EQU directives (already processed in the pre-pass)
             if opcode == "EQU":
                 continue
 
             # Handle ORG directive
             if opcode == "ORG":
-                address = self._parse_number(tokens[1])
-                continue
+                if len(tokens) < 2:
+                    raise SyntaxError(f"Line {line_num}: ORG requires an address")
+
+                try:
+                    address = self._parse_number(tokens[1])
+                except ValueError:
+                    raise SyntaxError(
+                        f"Line {line_num}: Invalid ORG address: {tokens[1]}"
+                    )
+
+                if not first_org_seen:
+                    output.starting_address = address
+                    first_org_seen = True
+
+                continue  # ORG doesn't generate code
 
             # Handle DS directive
             if opcode == "DS":
-                # Adjust for tokens layout based on label presence
-                instruction_index = 0
-                if parts[0].endswith(":"):
-                    instruction_index = 1
-                size_index = instruction_index + 1
-
-                if len(parts) <= size_index:
+                if len(tokens) < 2:
                     raise SyntaxError(f"Line {line_num}: DS requires a size")
 
                 try:
-                    # Join remaining parts as potential expression
-                    size_expr = " ".join(parts[size_index:])
-                    # Remove any trailing comments (already stripped above, but be safe)
-                    size_expr = size_expr.split(";")[0].strip()
-
-                    # Try to resolve as symbol first
-                    if size_expr in output.symbols:
-                        size = output.symbols[size_expr]
-                    else:
-                        # Try evaluate as expression (handles "10 + 5", "CONST * 2", etc.)
-                        result = self._evaluate_expression(size_expr, output, line_num)
-                        if result is not None:
-                            size = result
-                        else:
-                            size = self._parse_number(size_expr)
-
-                    # Mark as data memory (writable), not program memory (protected)
-                    for i in range(size):
-                        output.data_memory_range.add(address + i)
+                    # The tokenizer already rejoined split expressions, so the
+                    # size is almost always a single token - avoid the join
+                    size_expr = tokens[1] if len(tokens) == 2 else " ".join(tokens[1:])
+
+                    # Evaluate as symbol, number, or expression (handles "10",
+                    # "CONST", "10 + 5", "CONST * 2", etc.)
+                    size = self._evaluate_expression(size_expr, output, line_num)
+                    if size is None:
+                        size = self._parse_number(size_expr)
+
+                    # Mark as data memory (writable), not program memory
+                    # (protected) - one slice assignment for the whole range
+                    output.data_memory_flags[address : address + size] = (
+                        b"\x01" * size
+                    )
 
                     address += size
                 except ValueError as e:
@@ -809,685 +976,230 @@ class Assembler8085:
             if opcode == "END":
                 break
 
-            # Store tokens for this instruction
-            output.parsed_program.append((address, tokens))
-
-            # Mark this memory address as part of program
-            output.program_memory_range.add(address)
-
-            # Generate machine code based on instruction type
-            if opcode == "MVI":  # MVI r,data (2 bytes: opcode, immediate value)
-                # MVI opcodes: base 0x06 + (reg_code * 8)
-                # Register codes: B=0, C=1, D=2, E=3, H=4, L=5, M=6, A=7
-                reg = tokens[1].strip(",")
-                value_str = tokens[2].strip(",;")
-
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFF
-                    reg_code = self._get_reg_code(reg)
-                    output.memory[address] = 0x06 + (reg_code * 8)
-                    output.memory[address + 1] = value
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                address += 2
-
-            elif opcode == "MOV":  # MOV r,r (1 byte)
-                # MOV opcodes: 0x40 + (dest_reg * 8) + src_reg
-                # Register codes: B=0, C=1, D=2, E=3, H=4, L=5, M=6, A=7
-                dest_reg = tokens[1].strip(",")
-                src_reg = tokens[2].strip(",;")
-
-                # MOV M,M is invalid - opcode 0x76 is HLT
-                if dest_reg == "M" and src_reg == "M":
-                    raise SyntaxError(
-                        f"Line {line_num}: MOV M,M is not a valid instruction (opcode 0x76 is HLT)"
-                    )
-
-                try:
-                    dest_code = self._get_reg_code(dest_reg)
-                    src_code = self._get_reg_code(src_reg)
-                    output.memory[address] = 0x40 + (dest_code * 8) + src_code
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                address += 1
-
-            elif (
-                opcode == "LXI"
-            ):  # LXI rp,data16 (3 bytes: opcode, low byte, high byte)
-                # LXI opcodes: base 0x01 + (rp_code * 16)
-                # Register pair codes: B=0, D=1, H=2, SP=3
-                rp = tokens[1].strip(",")
-                value_str = tokens[2].strip(",;")
-
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFFFF
-                    rp_code = self._get_rp_code(rp)
-                    output.memory[address] = 0x01 + (rp_code * 16)
-                    output.memory[address + 1] = value & 0xFF  # Low byte
-                    output.memory[address + 2] = (value >> 8) & 0xFF  # High byte
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                output.program_memory_range.add(address + 2)
-                address += 3
-
-            elif (
-                opcode == "LDA"
-            ):  # LDA addr (3 bytes: opcode=0x3A, low byte, high byte)
-                value_str = tokens[1].strip(",;")
-
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFFFF
-                    output.memory[address] = 0x3A
-                    output.memory[address + 1] = value & 0xFF  # Low byte
-                    output.memory[address + 2] = (value >> 8) & 0xFF  # High byte
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                output.program_memory_range.add(address + 2)
-                address += 3
-
-            elif (
-                opcode == "STA"
-            ):  # STA addr (3 bytes: opcode=0x32, low byte, high byte)
-                value_str = tokens[1].strip(",;")
-
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFFFF
-                    output.memory[address] = 0x32
-                    output.memory[address + 1] = value & 0xFF  # Low byte
-                    output.memory[address + 2] = (value >> 8) & 0xFF  # High byte
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                output.program_memory_range.add(address + 2)
-                address += 3
-
-            elif opcode == "ADD":  # ADD r (1 byte)
-                # ADD opcodes: 0x80 + reg_code
-                reg = tokens[1].strip(",;")
-
-                try:
-                    reg_code = self._get_reg_code(reg)
-                    output.memory[address] = 0x80 + reg_code
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                address += 1
-
-            elif opcode == "ADI":  # ADI data (2 bytes: opcode=0xC6, immediate value)
-                value_str = tokens[1].strip(",;")
-
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFF
-                    output.memory[address] = 0xC6
-                    output.memory[address + 1] = value
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                address += 2
-
-            elif opcode == "SUB":  # SUB r (1 byte)
-                # SUB opcodes: 0x90 + reg_code
-                reg = tokens[1].strip(",;")
-
-                try:
-                    reg_code = self._get_reg_code(reg)
-                    output.memory[address] = 0x90 + reg_code
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                address += 1
-
-            elif opcode == "INR":  # INR r (1 byte)
-                # INR opcodes: 0x04 + (reg_code * 8)
-                reg = tokens[1].strip(",;")
-
-                try:
-                    reg_code = self._get_reg_code(reg)
-                    output.memory[address] = 0x04 + (reg_code * 8)
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                address += 1
-
-            elif opcode == "DCR":  # DCR r (1 byte)
-                # DCR opcodes: 0x05 + (reg_code * 8)
-                reg = tokens[1].strip(",;")
-
-                try:
-                    reg_code = self._get_reg_code(reg)
-                    output.memory[address] = 0x05 + (reg_code * 8)
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                address += 1
-
-            elif opcode in [
-                "JMP",
-                "JZ",
-                "JNZ",
-                "JC",
-                "JNC",
-                "JP",
-                "JM",
-                "JPE",
-                "JPO",
-            ]:  # Jumps (3 bytes)
-                # Jump opcodes: JMP=0xC3, JZ=0xCA, JNZ=0xC2, JC=0xDA, JNC=0xD2, JP=0xF2, JM=0xFA, JPE=0xEA, JPO=0xE2
-                value_str = tokens[1].strip(",;")
-
-                jump_opcodes = {
-                    "JMP": 0xC3,
-                    "JZ": 0xCA,
-                    "JNZ": 0xC2,
-                    "JC": 0xDA,
-                    "JNC": 0xD2,
-                    "JP": 0xF2,
-                    "JM": 0xFA,
-                    "JPE": 0xEA,
-                    "JPO": 0xE2,
-                }
-
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFFFF
-                    output.memory[address] = jump_opcodes[opcode]
-                    output.memory[address + 1] = value & 0xFF  # Low byte
-                    output.memory[address + 2] = (value >> 8) & 0xFF  # High byte
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-                except KeyError:
-                    raise SyntaxError(
-                        f"Line {line_num}: Invalid jump instruction: {opcode}"
-                    )
-
-                output.program_memory_range.add(address + 1)
-                output.program_memory_range.add(address + 2)
-                address += 3
-
-            elif opcode == "HLT":  # HLT (1 byte: opcode=0x76)
-                output.memory[address] = 0x76
-                address += 1
-
-            elif opcode == "INX":  # INX rp (1 byte)
-                # INX opcodes: 0x03 + (rp_code * 16)
-                rp = tokens[1].strip(",;")
-
-                try:
-                    rp_code = self._get_rp_code(rp)
-                    output.memory[address] = 0x03 + (rp_code * 16)
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                address += 1
-
-            elif opcode == "PUSH":  # PUSH rp (1 byte)
-                # PUSH opcodes: 0xC5 + (rp_code * 16)
-                rp = tokens[1].strip(",;")
-
-                # Special case: PUSH PSW (Program Status Word)
-                if rp == "PSW":
-                    output.memory[address] = 0xF5
-                else:
-                    try:
-                        rp_code = self._get_rp_code(rp)
-                        output.memory[address] = 0xC5 + (rp_code * 16)
-                    except ValueError as e:
-                        if rp != "PSW":  # PSW already handled
-                            raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                address += 1
-
-            elif opcode == "POP":  # POP rp (1 byte)
-                # POP opcodes: 0xC1 + (rp_code * 16)
-                rp = tokens[1].strip(",;")
-
-                # Special case: POP PSW (Program Status Word)
-                if rp == "PSW":
-                    output.memory[address] = 0xF1
-                else:
-                    try:
-                        rp_code = self._get_rp_code(rp)
-                        output.memory[address] = 0xC1 + (rp_code * 16)
-                    except ValueError as e:
-                        if rp != "PSW":  # PSW already handled
-                            raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                address += 1
-
-            elif (
-                opcode == "CALL"
-            ):  # CALL addr (3 bytes: opcode=0xCD, low byte, high byte)
-                value_str = tokens[1].strip(",;")
-
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFFFF
-                    output.memory[address] = 0xCD
-                    output.memory[address + 1] = value & 0xFF  # Low byte
-                    output.memory[address + 2] = (value >> 8) & 0xFF  # High byte
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                output.program_memory_range.add(address + 2)
-                address += 3
-
-            elif opcode == "RET":  # RET (1 byte: opcode=0xC9)
-                output.memory[address] = 0xC9
-                address += 1
-
-            elif opcode == "CPI":  # CPI data (2 bytes: opcode=0xFE, immediate value)
-                value_str = tokens[1].strip(",;")
-
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFF
-                    output.memory[address] = 0xFE
-                    output.memory[address + 1] = value
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                address += 2
-
-            elif opcode == "DAD":  # DAD rp (1 byte)
-                # DAD opcodes: 0x09 + (rp_code * 16)
-                rp = tokens[1].strip(",;")
-
-                try:
-                    rp_code = self._get_rp_code(rp)
-                    output.memory[address] = 0x09 + (rp_code * 16)
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                address += 1
-
-            elif opcode == "XCHG":  # XCHG (1 byte: opcode=0xEB)
-                output.memory[address] = 0xEB
-                address += 1
-
-            elif opcode == "LDAX":  # LDAX rp (1 byte)
-                # LDAX opcodes: B=0x0A, D=0x1A
-                rp = tokens[1].strip(",;")
-
-                if rp == "B":
-                    output.memory[address] = 0x0A
-                elif rp == "D":
-                    output.memory[address] = 0x1A
-                else:
-                    raise SyntaxError(
-                        f"Line {line_num}: LDAX only supports B or D register pairs"
-                    )
-
-                address += 1
-
-            elif opcode == "STAX":  # STAX rp (1 byte)
-                # STAX opcodes: B=0x02, D=0x12
-                rp = tokens[1].strip(",;")
-
-                if rp == "B":
-                    output.memory[address] = 0x02
-                elif rp == "D":
-                    output.memory[address] = 0x12
-                else:
-                    raise SyntaxError(
-                        f"Line {line_num}: STAX only supports B or D register pairs"
-                    )
-
-                address += 1
-
-            elif (
-                opcode == "LHLD"
-            ):  # LHLD addr (3 bytes: opcode=0x2A, low byte, high byte)
-                value_str = tokens[1].strip(",;")
-
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFFFF
-                    output.memory[address] = 0x2A
-                    output.memory[address + 1] = value & 0xFF  # Low byte
-                    output.memory[address + 2] = (value >> 8) & 0xFF  # High byte
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                output.program_memory_range.add(address + 2)
-                address += 3
-
-            elif (
-                opcode == "SHLD"
-            ):  # SHLD addr (3 bytes: opcode=0x22, low byte, high byte)
-                value_str = tokens[1].strip(",;")
-
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFFFF
-                    output.memory[address] = 0x22
-                    output.memory[address + 1] = value & 0xFF  # Low byte
-                    output.memory[address + 2] = (value >> 8) & 0xFF  # High byte
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                output.program_memory_range.add(address + 2)
-                address += 3
-
-            elif opcode == "PCHL":  # PCHL (1 byte: opcode=0xE9)
-                output.memory[address] = 0xE9
-                address += 1
-
-            elif opcode == "SPHL":  # SPHL (1 byte: opcode=0xF9)
-                output.memory[address] = 0xF9
-                address += 1
-
-            elif opcode == "XTHL":  # XTHL (1 byte: opcode=0xE3)
-                output.memory[address] = 0xE3
-                address += 1
-
-            elif opcode == "ANA":  # ANA r/M (1 byte): AND register/memory with A
-                reg = tokens[1].strip(",;")
-                if reg not in self.valid_registers:
-                    raise SyntaxError(f"Line {line_num}: Invalid register '{reg}'")
-
-                reg_code = self._get_reg_code(reg)
-                output.memory[address] = 0xA0 | reg_code
-                address += 1
-
-            elif opcode == "ANI":  # ANI data (2 bytes): AND immediate with A
-                value_str = tokens[1].strip(",;")
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFF
-                    output.memory[address] = 0xE6  # Opcode
-                    output.memory[address + 1] = value  # Immediate data
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                address += 2
-
-            elif opcode == "ORA":  # ORA r/M (1 byte): OR register/memory with A
-                reg = tokens[1].strip(",;")
-                if reg not in self.valid_registers:
-                    raise SyntaxError(f"Line {line_num}: Invalid register '{reg}'")
-
-                reg_code = self._get_reg_code(reg)
-                output.memory[address] = 0xB0 | reg_code
-                address += 1
-
-            elif opcode == "ORI":  # ORI data (2 bytes): OR immediate with A
-                value_str = tokens[1].strip(",;")
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFF
-                    output.memory[address] = 0xF6  # Opcode
-                    output.memory[address + 1] = value  # Immediate data
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                address += 2
-
-            elif opcode == "XRA":  # XRA r/M (1 byte): XOR register/memory with A
-                reg = tokens[1].strip(",;")
-                if reg not in self.valid_registers:
-                    raise SyntaxError(f"Line {line_num}: Invalid register '{reg}'")
-
-                reg_code = self._get_reg_code(reg)
-                output.memory[address] = 0xA8 | reg_code
-                address += 1
-
-            elif opcode == "XRI":  # XRI data (2 bytes): XOR immediate with A
-                value_str = tokens[1].strip(",;")
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFF
-                    output.memory[address] = 0xEE  # Opcode
-                    output.memory[address + 1] = value  # Immediate data
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                address += 2
-
-            elif opcode == "CMA":  # CMA (1 byte): Complement accumulator
-                output.memory[address] = 0x2F
-                address += 1
-
-            elif opcode == "CMC":  # CMC (1 byte): Complement carry flag
-                output.memory[address] = 0x3F
-                address += 1
-
-            elif opcode == "STC":  # STC (1 byte): Set carry flag
-                output.memory[address] = 0x37
-                address += 1
-
-            elif opcode == "RLC":  # RLC (1 byte): Rotate accumulator left
-                output.memory[address] = 0x07
-                address += 1
-
-            elif opcode == "RRC":  # RRC (1 byte): Rotate accumulator right
-                output.memory[address] = 0x0F
-                address += 1
-
-            elif opcode == "RAL":  # RAL (1 byte): Rotate accumulator left through carry
-                output.memory[address] = 0x17
-                address += 1
-
-            elif (
-                opcode == "RAR"
-            ):  # RAR (1 byte): Rotate accumulator right through carry
-                output.memory[address] = 0x1F
-                address += 1
-
-            elif opcode == "ADC":  # ADC r/M (1 byte): Add with carry
-                reg = tokens[1].strip(",;")
-                if reg not in self.valid_registers:
-                    raise SyntaxError(f"Line {line_num}: Invalid register '{reg}'")
-
-                reg_code = self._get_reg_code(reg)
-                output.memory[address] = 0x88 | reg_code
-                address += 1
-
-            elif opcode == "ACI":  # ACI data (2 bytes): Add immediate with carry
-                value_str = tokens[1].strip(",;")
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFF
-                    output.memory[address] = 0xCE  # Opcode
-                    output.memory[address + 1] = value  # Immediate data
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                address += 2
-
-            elif opcode == "SBB":  # SBB r/M (1 byte): Subtract with borrow
-                reg = tokens[1].strip(",;")
-                if reg not in self.valid_registers:
-                    raise SyntaxError(f"Line {line_num}: Invalid register '{reg}'")
-
-                reg_code = self._get_reg_code(reg)
-                output.memory[address] = 0x98 | reg_code
-                address += 1
-
-            elif opcode == "SBI":  # SBI data (2 bytes): Subtract immediate with borrow
-                value_str = tokens[1].strip(",;")
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFF
-                    output.memory[address] = 0xDE  # Opcode
-                    output.memory[address + 1] = value  # Immediate data
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                address += 2
-
-            elif opcode == "DAA":  # DAA (1 byte): Decimal adjust accumulator
-                output.memory[address] = 0x27
-                address += 1
-
-            elif opcode == "DCX":  # DCX rp (1 byte): Decrement register pair
-                reg_pair = tokens[1].strip(",;")
-
-                try:
-                    rp_code = self._get_rp_code(reg_pair)
-                    output.memory[address] = 0x0B + (rp_code * 16)
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                address += 1
-
-            elif opcode in ["CC", "CNC", "CZ", "CNZ", "CP", "CM", "CPE", "CPO"]:
-                # Conditional call opcodes mapping
-                call_opcodes = {
-                    "CC": 0xDC,  # Call if carry
-                    "CNC": 0xD4,  # Call if no carry
-                    "CZ": 0xCC,  # Call if zero
-                    "CNZ": 0xC4,  # Call if not zero
-                    "CP": 0xF4,  # Call if positive (S=0)
-                    "CM": 0xFC,  # Call if minus (S=1)
-                    "CPE": 0xEC,  # Call if parity even
-                    "CPO": 0xE4,  # Call if parity odd
-                }
-
-                value_str = tokens[1].strip(",;")
-
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFFFF
-                    output.memory[address] = call_opcodes[opcode]
-                    output.memory[address + 1] = value & 0xFF  # Low byte
-                    output.memory[address + 2] = (value >> 8) & 0xFF  # High byte
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-
-                output.program_memory_range.add(address + 1)
-                output.program_memory_range.add(address + 2)
-                address += 3
-
-            elif opcode in ["RC", "RNC", "RZ", "RNZ", "RP", "RM", "RPE", "RPO"]:
-                # Conditional return opcodes mapping
-                ret_opcodes = {
-                    "RC": 0xD8,  # Return if carry
-                    "RNC": 0xD0,  # Return if no carry
-                    "RZ": 0xC8,  # Return if zero
-                    "RNZ": 0xC0,  # Return if not zero
-                    "RP": 0xF0,  # Return if positive (S=0)
-                    "RM": 0xF8,  # Return if minus (S=1)
-                    "RPE": 0xE8,  # Return if parity even
-                    "RPO": 0xE0,  # Return if parity odd
-                }
-
-                output.memory[address] = ret_opcodes[opcode]
-                address += 1
-
-            elif opcode == "RST":
-                # RST n opcodes: 0xC7, 0xCF, 0xD7, 0xDF, 0xE7, 0xEF, 0xF7, 0xFF for RST 0-7
-                # The number is 0-7 corresponding to 8 different restart addresses
-                rst_num = self._parse_number(tokens[1].strip(",;"))
-
-                if rst_num < 0 or rst_num > 7:
-                    raise SyntaxError(
-                        f"Line {line_num}: RST requires a number from 0-7"
-                    )
-
-                # Calculate opcode: RST n = 11NNN111 where NNN is the 3-bit value of n
-                output.memory[address] = 0xC7 | (rst_num << 3)
-                address += 1
+            # Map the line to the current address
+            line_to_address_map[line_num] = address
+            address_to_line_map[address] = line_num
 
-            elif opcode == "CMP":  # CMP r/M (1 byte): Compare register/memory with A
-                reg = tokens[1].strip(",;")
-                if reg not in self.valid_registers:
-                    raise SyntaxError(f"Line {line_num}: Invalid register '{reg}'")
+            # Store the display token form so execution-log lines and
+            # last_instruction keep the source's operand punctuation
+            parsed_program_append((address, display_tokens))
 
-                reg_code = self._get_reg_code(reg)
-                output.memory[address] = 0xB8 | reg_code
-                address += 1
+            # Mark this memory address as part of program
+            program_flags[address] = 1
 
-            elif opcode == "NOP":  # NOP (1 byte: opcode=0x00)
-                output.memory[address] = 0x00
+            # Zero-operand instructions are the most common shape; write the
+            # constant byte inline rather than paying a handler call for it
+            fixed_byte = fixed_byte_get(opcode)
+            if fixed_byte is not None:
+                mem[address] = fixed_byte
                 address += 1
+                continue
 
-            elif opcode == "SUI":  # SUI data (2 bytes: opcode=0xD6, immediate value)
-                value_str = tokens[1].strip(",;")
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFF
-                    output.memory[address] = 0xD6
-                    output.memory[address + 1] = value
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-                output.program_memory_range.add(address + 1)
-                address += 2
-
-            elif opcode == "IN":  # IN port (2 bytes: opcode=0xDB, port address)
-                value_str = tokens[1].strip(",;")
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFF
-                    output.memory[address] = 0xDB
-                    output.memory[address + 1] = value
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-                output.program_memory_range.add(address + 1)
-                address += 2
-
-            elif opcode == "OUT":  # OUT port (2 bytes: opcode=0xD3, port address)
-                value_str = tokens[1].strip(",;")
-                try:
-                    value = self._resolve_symbol_or_number(value_str, output) & 0xFF
-                    output.memory[address] = 0xD3
-                    output.memory[address + 1] = value
-                except ValueError as e:
-                    raise SyntaxError(f"Line {line_num}: {str(e)}")
-                output.program_memory_range.add(address + 1)
-                address += 2
-
-            elif opcode == "EI":  # EI (1 byte: opcode=0xFB)
-                output.memory[address] = 0xFB
-                address += 1
+            # Repeated instruction lines are common; if this exact token
+            # sequence already encoded cleanly, copy its bytes instead of
+            # re-running the handler. Within one run every symbol and label
+            # resolves to a single value, so the bytes are identical.
+            key = tuple(tokens)
+            cached = enc_cache.get(key)
+            if cached is not None:
+                size = len(cached)
+                mem[address : address + size] = cached
+                program_flags[address : address + size] = b"\x01" * size
+                address += size
+                continue
 
-            elif opcode == "DI":  # DI (1 byte: opcode=0xF3)
-                output.memory[address] = 0xF3
-                address += 1
+            # Generate machine code via the per-mnemonic handler; each
+            # handler returns the number of bytes it emitted
+            fixup_count = len(fixups)
+            size = emit_dispatch[opcode](opcode, tokens, address, output, line_num)
 
-            elif opcode == "RIM":  # RIM (1 byte: opcode=0x20)
-                output.memory[address] = 0x20
-                address += 1
+            # Encodings that deferred a fixup hold placeholder bytes and
+            # must not be replayed from the cache
+            if len(fixups) == fixup_count:
+                enc_cache[key] = bytes(mem[address : address + size])
 
-            elif opcode == "SIM":  # SIM (1 byte: opcode=0x30)
-                output.memory[address] = 0x30
-                address += 1
+            address += size
 
         # Update program metadata after assembly
         if output.parsed_program:
             output.program_end_address = address
 
+    def _emit_fixed(self, opcode, tokens, address, output, line_num):
+        """Emit a fixed one-byte instruction with no operand"""
+        output.mem[address] = _FIXED_BYTE_OPCODES[opcode]
+        return 1
+
+    def _emit_reg_arith(self, opcode, tokens, address, output, line_num):
+        """Emit a one-byte register instruction (base + reg_code * multiplier)"""
+        reg = tokens[1]
+        reg_code = self._reg_code.get(reg)
+        if reg_code is None:
+            raise SyntaxError(f"Line {line_num}: Invalid register: {reg}")
+
+        base, mult = _REG_ARITH_BASES[opcode]
+        output.mem[address] = base + (reg_code * mult)
+        return 1
+
+    def _emit_reg_logical(self, opcode, tokens, address, output, line_num):
+        """Emit a one-byte ALU instruction (base | reg_code)"""
+        reg = tokens[1]
+        reg_code = self._reg_code.get(reg)
+        if reg_code is None:
+            raise SyntaxError(f"Line {line_num}: Invalid register '{reg}'")
+
+        output.mem[address] = _REG_LOGICAL_BASES[opcode] | reg_code
+        return 1
+
+    def _emit_rp_op(self, opcode, tokens, address, output, line_num):
+        """Emit a one-byte register-pair instruction (INX/DCX/DAD/PUSH/POP)"""
+        rp = tokens[1]
+
+        byte = _RP_ENCODED.get((opcode, rp))
+        if byte is None:
+            raise SyntaxError(f"Line {line_num}: Invalid register pair: {rp}")
+
+        output.mem[address] = byte
+        return 1
+
+    def _emit_immediate(self, opcode, tokens, address, output, line_num):
+        """Emit a two-byte instruction with an 8-bit immediate operand"""
+        value = (
+            self._resolve_or_defer(tokens[1], output, address + 1, line_num, 1) & 0xFF
+        )
+        _PACK_BB(output.mem, address, _IMMEDIATE_OPCODES[opcode], value)
+        output.program_memory_flags[address + 1] = 1
+        return 2
+
+    def _emit_addr(self, opcode, tokens, address, output, line_num):
+        """Emit a three-byte instruction with a 16-bit address operand"""
+        value = (
+            self._resolve_or_defer(tokens[1], output, address + 1, line_num, 2)
+            & 0xFFFF
+        )
+        _PACK_BH(output.mem, address, _ADDR_OPCODES[opcode], value)
+        output.program_memory_flags[address + 1] = 1
+        output.program_memory_flags[address + 2] = 1
+        return 3
+
+    def _emit_mvi(self, opcode, tokens, address, output, line_num):
+        """Emit MVI r,data (2 bytes: opcode 0x06 + reg_code * 8, immediate)"""
+        reg_code = self._reg_code.get(tokens[1])
+        if reg_code is None:
+            raise SyntaxError(f"Line {line_num}: Invalid register: {tokens[1]}")
+
+        value = (
+            self._resolve_or_defer(tokens[2], output, address + 1, line_num, 1) & 0xFF
+        )
+        _PACK_BB(output.mem, address, 0x06 + (reg_code * 8), value)
+        output.program_memory_flags[address + 1] = 1
+        return 2
+
+    def _emit_mov(self, opcode, tokens, address, output, line_num):
+        """Emit MOV r,r (1 byte: 0x40 + dest_code * 8 + src_code)"""
+        dest_reg = tokens[1]
+        src_reg = tokens[2]
+
+        byte = _MOV_TABLE.get((dest_reg, src_reg))
+        if byte is None:
+            # MOV M,M is invalid - opcode 0x76 is HLT
+            if dest_reg == "M" and src_reg == "M":
+                raise SyntaxError(
+                    f"Line {line_num}: MOV M,M is not a valid instruction (opcode 0x76 is HLT)"
+                )
+            bad = dest_reg if dest_reg not in self._reg_code else src_reg
+            raise SyntaxError(f"Line {line_num}: Invalid register: {bad}")
+
+        output.mem[address] = byte
+        return 1
+
+    def _emit_lxi(self, opcode, tokens, address, output, line_num):
+        """Emit LXI rp,data16 (3 bytes: opcode 0x01 + rp_code * 16, low, high)"""
+        rp_code = self._rp_code.get(tokens[1])
+        if rp_code is None:
+            raise SyntaxError(f"Line {line_num}: Invalid register pair: {tokens[1]}")
+
+        value = (
+            self._resolve_or_defer(tokens[2], output, address + 1, line_num, 2)
+            & 0xFFFF
+        )
+        _PACK_BH(output.mem, address, 0x01 + (rp_code * 16), value)
+        output.program_memory_flags[address + 1] = 1
+        output.program_memory_flags[address + 2] = 1
+        return 3
+
+    def _emit_ldax(self, opcode, tokens, address, output, line_num):
+        """Emit LDAX rp (1 byte: B=0x0A, D=0x1A)"""
+        rp = tokens[1]
+
+        if rp == "B":
+            output.mem[address] = 0x0A
+        elif rp == "D":
+            output.mem[address] = 0x1A
+        else:
+            raise SyntaxError(
+                f"Line {line_num}: LDAX only supports B or D register pairs"
+            )
+
+        return 1
+
+    def _emit_stax(self, opcode, tokens, address, output, line_num):
+        """Emit STAX rp (1 byte: B=0x02, D=0x12)"""
+        rp = tokens[1]
+
+        if rp == "B":
+            output.mem[address] = 0x02
+        elif rp == "D":
+            output.mem[address] = 0x12
+        else:
+            raise SyntaxError(
+                f"Line {line_num}: STAX only supports B or D register pairs"
+            )
+
+        return 1
+
+    def _emit_rst(self, opcode, tokens, address, output, line_num):
+        """Emit RST n (1 byte: precomputed vector byte for n in 0-7)"""
+        rst_num = self._parse_number(tokens[1])
+
+        if not 0 <= rst_num <= 7:
+            raise SyntaxError(f"Line {line_num}: RST requires a number from 0-7")
+
+        output.mem[address] = _RST_OPCODES[rst_num]
+        return 1
+
     def _get_reg_code(self, reg):
         """Get numeric code for a register (B=0, C=1, D=2, E=3, H=4, L=5, M=6, A=7)"""
-        if reg not in self.valid_registers:
+        code = self._reg_code.get(reg)
+        if code is None:
             raise ValueError(f"Invalid register: {reg}")
-        return self.valid_registers.index(reg)
+        return code
 
     def _get_rp_code(self, reg_pair):
         """Get numeric code for a register pair (B=0, D=1, H=2, SP=3)"""
-        if reg_pair not in self.valid_register_pairs:
+        code = self._rp_code.get(reg_pair)
+        if code is None:
             raise ValueError(f"Invalid register pair: {reg_pair}")
-        return self.valid_register_pairs.index(reg_pair)
+        return code
 
     def _parse_number(self, value_str):
         """
-        Parse a numeric literal in either decimal or hexadecimal format.
+        Parse a numeric literal in decimal, hexadecimal, or binary format.
 
         For hexadecimal, the format should be a number followed by 'H' (e.g., '3AH').
+        For binary, a number followed by 'B' (e.g., '1010B').
         For decimal, just the number is provided.
 
         Returns the parsed number as an integer.
         """
         value_str = value_str.strip()
 
-        # Check for hexadecimal (suffix H)
-        if value_str.upper().endswith("H"):
-            hex_str = value_str[:-1]
-            return int(hex_str, 16)
+        # Classify on the last character: hexadecimal (suffix H), binary
+        # (suffix B), otherwise decimal
+        if value_str:
+            last = value_str[-1]
+            if last == "H" or last == "h":
+                return int(value_str[:-1], 16)
+            if last == "B" or last == "b":
+                return int(value_str[:-1], 2)
 
-        # Otherwise, treat as decimal
         return int(value_str, 10)
@@ -18,8 +18,12 @@
 # with integrated editor, assembler, and debugging capabilities
 
 # Standard library imports
+import functools
 import os
+import re
 import sys
+import time
+from collections import OrderedDict, deque
 
 def resource_path(relative_path):
     """Get absolute path to resource"""
@@ -32,14 +36,16 @@ def resource_path(relative_path):
 from PySide6.QtCore import (
     QDateTime,
     QElapsedTimer,
+    QPoint,
     QRect,
-    QRegularExpression,
     QSize,
     QTimer,
     Qt,
+    Signal,
 )
 from PySide6.QtGui import (
     QAction,
+    QBrush,
     QColor,
     QFont,
     QFontMetrics,
@@ -85,39 +91,28 @@ class ZoomMixin:
     def __init__(self, *args, **kwargs):
         font_point_size = kwargs["font_point_size"]
         del kwargs["font_point_size"]
+        font_family = kwargs.pop("font_family", "Consolas")
         super(ZoomMixin, self).__init__(*args, **kwargs)
         self.font_point_size = font_point_size
+        self._font = QFont(font_family, font_point_size)
+        self.setFont(self._font)
 
-    def zoom_in(self):
-        """Zoom in"""
-        current_size = self.font().pointSize()
-        self.setFont(QFont(self.font().family(), current_size + 1))
-        self.set_fixed_height()
-
-    def zoom_out(self):
-        """Zoom out"""
-        current_size = self.font().pointSize()
-        if current_size > (4 if self.font_point_size == 12 else (2 if self.font_point_size == 10 else 1)):
-            self.setFont(QFont(self.font().family(), current_size - 1))
-        self.set_fixed_height()
-
-    def reset_zoom(self):
-        """Reset zoom"""
-        self.setFont(QFont(self.font().family(), self.font_point_size))
+    def apply_zoom(self, zoom_level):
+        """Apply the shared zoom level relative to this widget's base size"""
+        self._font.setPointSize(self.font_point_size + zoom_level)
+        self.setFont(self._font)
         self.set_fixed_height()
 
     def set_fixed_height(self):
-        if type(self) == Header:
-            fm = QFontMetrics(self.font())
-            self.setFixedHeight(fm.height() * 1.43)
+        """No-op by default; widgets with a font-derived fixed height override"""
+        pass
 
 
 class Label(ZoomMixin, QLabel):
     """Label - QLabel wrapper"""
 
     def __init__(self, text: str, font_family="Consolas", font_point_size=12):
-        super().__init__(text, font_point_size=font_point_size)
-        self.setFont(QFont(font_family, font_point_size))
+        super().__init__(text, font_family=font_family, font_point_size=font_point_size)
 
 
 class Header(Label):
@@ -131,38 +126,38 @@ class Header(Label):
         )
         self.setAlignment(Qt.AlignCenter)
 
+    def set_fixed_height(self):
+        fm = QFontMetrics(self.font())
+        self.setFixedHeight(fm.height() * 1.43)
+
 
 class LineEdit(ZoomMixin, QLineEdit):
     """LineEdit - QLineEdit wrapper"""
 
     def __init__(self, place_holder_text: str):
         super().__init__(font_point_size=10)
-        self.setFont(QFont("Consolas", 10))
         self.setPlaceholderText(place_holder_text)
 
 
-class TextEdit(ZoomMixin, QTextEdit):
-    """TextEdit - QTextEdit wrapper"""
+class PlainTextEdit(ZoomMixin, QPlainTextEdit):
+    """PlainTextEdit - QPlainTextEdit wrapper"""
 
     def __init__(self):
         super().__init__(font_point_size=10)
-        self.setFont(QFont("Consolas", 10))
 
 
 class PushButton(ZoomMixin, QPushButton):
     """Label - QPushButton wrapper"""
 
     def __init__(self, text: str):
-        super().__init__(text, font_point_size=10)
-        self.setFont(QFont("Segoe UI", 10))
+        super().__init__(text, font_family="Segoe UI", font_point_size=10)
 
 
 class TableWidgetItem(ZoomMixin, QTableWidgetItem):
     """TableWidgetItem - QTableWidgetItem wrapper"""
 
     def __init__(self, text: str):
-        super().__init__(text, font_point_size=10)
-        self.setFont(QFont("Segoe UI", 10))
+        super().__init__(text, font_family="Segoe UI", font_point_size=10)
 
 
 # ZoomMixin did not work with QMenuBar, hence this is kind of a hack!
@@ -171,47 +166,51 @@ class MenuBar(QMenuBar):
     def __init__(self, parent = None):
         super().__init__(parent)
         self.font_point_size = 10
-        self.__style_sheet = """
-            QMenuBar {{
-                font: {size}pt "Segoe UI";
+        self._font = QFont("Segoe UI", self.font_point_size)
+        self.setFont(self._font)
+        # Static sheet without a font declaration, so zooming only needs
+        # setFont instead of a full stylesheet reparse and re-polish
+        self.setStyleSheet("""
+            QMenuBar {
                 background-color: white;
                 color: #1E1E1E;
                 border-bottom: 1px solid #DDDDDD;
                 padding: 0px;
                 margin: 0px;
-            }}
-            QMenuBar::item {{
+            }
+            QMenuBar::item {
                 background: transparent;
                 padding: 4px 10px;
-            }}
-            QMenuBar::item:selected {{
+            }
+            QMenuBar::item:selected {
                 background-color: #CBE3F8;
-            }}
-            QMenu {{
-                font: {size}pt "Segoe UI";
+            }
+            QMenu {
                 background-color: white;
                 border: 1px solid #CCCCCC;
-            }}
-            QMenu::item:selected {{
+            }
+            QMenu::item:selected {
                 background-color: #CBE3F8;
-            }}
-        """
-        self.setStyleSheet(self.__style_sheet.format(size=self.font_point_size))
+            }
+        """)
 
-    def zoom_in(self):
-        """Zoom in"""
-        current_size = self.font().pointSize()
-        self.setStyleSheet(self.__style_sheet.format(size=current_size + 1))
+    def apply_zoom(self, zoom_level):
+        """Apply the shared zoom level"""
+        self._font.setPointSize(self.font_point_size + zoom_level)
+        self.setFont(self._font)
+        for menu in self.findChildren(QMenu):
+            menu.setFont(self._font)
 
-    def zoom_out(self):
-        """Zoom out"""
-        current_size = self.font().pointSize()
-        if current_size > 2:
-            self.setStyleSheet(self.__style_sheet.format(size=current_size - 1))
 
-    def reset_zoom(self):
-        """Reset zoom"""
-        self.setStyleSheet(self.__style_sheet.format(size=self.font_point_size))
+# Gutter paint constants, parsed from their hex strings once at import
+_LNA_BG = QColor("#F0F0F0")
+_LN_COLOR = QColor("#6D6D6D")
+_BP_COLOR = QColor("#DA0000")
+_BP_BRUSH = QBrush(_BP_COLOR)
+
+# Two-digit uppercase hex strings for every byte value, built once at import;
+# indexing this is cheaper than formatting in the memory-view refresh loops
+_HEX2 = tuple(f"{i:02X}" for i in range(256))
 
 
 class LineNumberArea(ZoomMixin, QWidget):
@@ -219,7 +218,6 @@ class LineNumberArea(ZoomMixin, QWidget):
 
     def __init__(self, editor):
         super().__init__(editor, font_point_size=12)
-        self.setFont(QFont("Consolas", 12))
         self.editor = editor
         self.simulator = None
         self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -236,48 +234,172 @@ class LineNumberArea(ZoomMixin, QWidget):
 
     def mousePressEvent(self, event):
         """Handle mouse clicks to toggle breakpoints on valid code lines"""
-        # Calculate which line was clicked
-        y_position = event.position().y()
-        block = self.editor.firstVisibleBlock()
-        top = (
-            self.editor.blockBoundingGeometry(block)
-            .translated(self.editor.contentOffset())
-            .top()
+        # Resolve the clicked line directly instead of walking visible blocks
+        cursor = self.editor.cursorForPosition(
+            QPoint(0, int(event.position().y()))
         )
+        line_number = cursor.blockNumber()
 
-        # Find the text block (line) that was clicked
-        while block.isValid():
-            block_height = self.editor.blockBoundingRect(block).height()
-            bottom = top + block_height
+        # Validate line has actual code (not empty or comment-only)
+        block_text = cursor.block().text().strip()
+        if block_text and not block_text.startswith(";"):
+            self.editor.toggleBreakpoint(line_number)
+        elif self.simulator:
+            self.simulator.add_to_log(
+                "Cannot add breakpoint on empty line or comment-only line",
+                "ERROR",
+            )
 
-            if top <= y_position <= bottom:
-                line_number = block.blockNumber()
-                # Validate line has actual code (not empty or comment-only)
-                block_text = (
-                    self.editor.document().findBlockByNumber(line_number).text().strip()
-                )
-                if block_text and not block_text.startswith(";"):
-                    self.editor.toggleBreakpoint(line_number)
-                else:
-                    if self.simulator:
-                        self.simulator.add_to_log(
-                            "Cannot add breakpoint on empty line or comment-only line",
-                            "ERROR",
-                        )
-                break
 
-            block = block.next()
-            top = bottom
+# Sample program shown in the editor on startup; the version number is
+# substituted on first use
+_SAMPLE_PROGRAM_TEMPLATE = r"""; +===================================================================+
+;     _   __           ____  ____  ____  ______
+;    / | / /__  ____  ( __ )/ __ \( __ )/ ____/
+;   /  |/ / _ \/ __ \/ __  / / / / __  /___ \  
+;  / /|  /  __/ /_/ / /_/ / /_/ / /_/ /___/ /  
+; /_/ |_/\___/\____/\____/\____/\____/_____/  
+;
+; Version: {V}
+;
+; Copyright 2026 (c) Shahibur Rahaman
+; Licensed under GNU GPL v3.0
+;
+; +==================================================================+
+; |       Welcome to Neo8085 - 8085 Microprocessor Simulator         |
+; +==================================================================+
+;
+; SIMULATOR USAGE INSTRUCTIONS:
+; ----------------------------
+; 1. EDITING & SAVING:
+;    - Type your assembly code in this editor
+;    - Save/Open files using File menu or Ctrl+S / Ctrl+O
+;    - Modified files show an asterisk (*) in the title bar
+;
+; 2. ASSEMBLING & EXECUTION:
+;    - Click "Assemble
+;    - "Step" (F10) to execute one instruction at a time
+;    - "Run" (F5) to execute continuously with highlighting
+;    - "Fast mode" (Ctrl+Shift+F5) to execute at higher speed without highlighting
+;    - "Stop" (F8) to pause continuous execution
+;    - "Reset" to clear processor state and memory
+;
+; 3. DEBUGGING FEATURES:
+;    - Add breakpoints by clicking in the line number margin
+;    - Or use F9 to add a breakpoint at the current line
+;    - Use the Memory Editor to modify memory
+;    - Use Memory table view to inspect and analyze the memory during execution
+;    - Follow PC button (toggle) tracks the Program Counter in memory
+;
+; 4. DIRECTIVE USAGE:
+;    - ORG: Set starting address - e.g., "ORG 2000H"
+;    - EQU: Define constants (supports arithmetic operations too) - e.g., "COUNT: EQU 5 * 5"
+;    - DS: Reserve memory space - e.g., "BUFFER: DS 10" 
+;    - END: A Placeholder representing the logical end of the progam
+;    - NOTE! Use JUMP instructions before "DS" directives to prevent no instruction found error. 
+;
+; EXAMPLE PROGRAM BELOW DEMONSTRATES:
+; - EQU nested directives with arithmetic
+; - Memory operations
+; - Register manipulation
+; - Program logic and looping
+; +===================================================================+
+;
+; ===================================================================
+;              FIBONACCI SERIES CALCULATION AND STORAGE
+; ===================================================================
+
+; - After assembling the code use the memory table view's search field
+;   to locate the loaded program (e.g., 2000H for our example program).
+; - Use "Follow PC" (toggle) to easily locate the current row of memory
+;   that is being executed (16 bytes per row). 
+
+ORG 2000H		; Due to presence of 'H' suffix this is treated as HEX value
+
+JMP START
+
+FIRST_ELEMENT:	EQU 0	; Treated as DECIMAL value due to lack of 'H' suffix
+SECOND_ELEMENT:	EQU 1	; Treated as DECIMAL value due to lack of 'H' suffix
+ELEMENTS_COUNT: 	EQU 0AH  ; 10 ELEMENTS (Treated as HEX value due to presence of 'H' suffix)
+LOOP_COUNTER:	EQU ELEMENTS_COUNT - 1 ; FIRST ONE ELEMENT IS NOT NEEDED FOR LOOPING
+
+; RESERVING MEMORY SPACE FOR STORING FIBONACCI SERIES
+DATA_AREA: DS ELEMENTS_COUNT
+
+START:	JMP FIBONACCI_SERIES_SETUP	; Jump to the respective label
+
+FIBONACCI_SERIES_SETUP:
+	MVI A, FIRST_ELEMENT
+	MVI B, SECOND_ELEMENT
+	MVI D, LOOP_COUNTER
+	LXI H, DATA_AREA
+	MOV M, A		; STORING THE FIRST ELEMENT IN MEMORY
+	INX H		; INCREASING MEMORY ADDRESS REGISTER VALUE (H-L REGISTER PAIR)
+	JMP FIBONACCI_CALC_LOOP
+
+FIBONACCI_CALC_LOOP:
+	MOV C, A
+	ADD B
+	MOV B, C
+	DCR D		; DECREASE THE VALUE OF THE LOOP COUNTER REGISTER
+	MOV M, A
+	INX H
+	JNZ FIBONACCI_CALC_LOOP
+	JMP END_OF_PROGRAM
+
+END_OF_PROGRAM:
+	HLT
+
+END
+
+"""
+
+
+@functools.cache
+def _sample_program():
+    """Return the version-stamped sample program, built once on first use"""
+    return _SAMPLE_PROGRAM_TEMPLATE.replace("{V}", display_version)
+
+
+# 8085 instruction set
+_INSTRUCTIONS = frozenset([
+    "MVI", "MOV", "LXI", "LDA", "STA", "ADD", "ADI", "SUB", "INR", "DCR",
+    "JMP", "JZ", "JNZ", "JC", "JNC", "JP", "JM", "JPE", "JPO", "HLT",
+    "INX", "PUSH", "POP", "CALL", "RET", "CPI", "DAD", "XCHG", "LDAX",
+    "STAX", "LHLD", "SHLD", "PCHL", "SPHL", "XTHL", "ANA", "ANI", "ORA",
+    "ORI", "XRA", "XRI", "CMA", "CMC", "STC", "RLC", "RRC", "RAL", "RAR",
+    "ADC", "ACI", "SBB", "SBI", "DAA", "DCX", "CC", "CNC", "CZ", "CNZ",
+    "CP", "CM", "CPE", "CPO", "RC", "RNC", "RZ", "RNZ", "RP", "RM", "RPE",
+    "RPO", "RST", "CMP", "NOP", "SUI", "IN", "OUT", "EI", "DI", "RIM",
+    "SIM",
+])
+
+# Assembler directives
+_DIRECTIVES = frozenset(["DS", "ORG", "END", "EQU"])
+
+# Registers
+_REGISTERS = frozenset(["A", "B", "C", "D", "E", "H", "L", "M", "SP", "PSW"])
+
+# One scan of the line yields comment, identifier/label, and number tokens;
+# each token is then classified with a dict lookup instead of sweeping the
+# line once per regex rule
+_TOKEN_RE = re.compile(r";[^\n]*|[A-Za-z_][A-Za-z0-9_]*:?|[0-9][0-9A-Za-z]*")
+_HEX_TOKEN_RE = re.compile(r"[0-9A-Fa-f]+[Hh]")
 
 
 class AssemblyHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for 8085 assembly language with customized color scheme"""
 
+    # Formatted-span cache shared across highlighter instances: assembly
+    # source repeats lines heavily (MOV A, B and friends), so identical text
+    # replays its (start, length, format) spans without touching the regex
+    # engine. Oldest entries are evicted once the cap is reached.
+    _fmt_cache = OrderedDict()
+    _FMT_CACHE_MAX = 2048
+
     def __init__(self, document):
         super().__init__(document)
 
-        self.highlighting_rules = []
-
         # Format definitions with appropriate colors for code elements
         instruction_format = QTextCharFormat()
         instruction_format.setForeground(QColor("#8A2BE2"))  # Purple
@@ -303,139 +425,64 @@ class AssemblyHighlighter(QSyntaxHighlighter):
         directive_format.setForeground(QColor("#FF6600"))  # Orange
         directive_format.setFontWeight(QFont.Weight.Bold)
 
-        # 8085 instruction set
-        instructions = [
-            "MVI",
-            "MOV",
-            "LXI",
-            "LDA",
-            "STA",
-            "ADD",
-            "ADI",
-            "SUB",
-            "INR",
-            "DCR",
-            "JMP",
-            "JZ",
-            "JNZ",
-            "JC",
-            "JNC",
-            "JP",
-            "JM",
-            "JPE",
-            "JPO",
-            "HLT",
-            "INX",
-            "PUSH",
-            "POP",
-            "CALL",
-            "RET",
-            "CPI",
-            "DAD",
-            "XCHG",
-            "LDAX",
-            "STAX",
-            "LHLD",
-            "SHLD",
-            "PCHL",
-            "SPHL",
-            "XTHL",
-            "ANA",
-            "ANI",
-            "ORA",
-            "ORI",
-            "XRA",
-            "XRI",
-            "CMA",
-            "CMC",
-            "STC",
-            "RLC",
-            "RRC",
-            "RAL",
-            "RAR",
-            "ADC",
-            "ACI",
-            "SBB",
-            "SBI",
-            "DAA",
-            "DCX",
-            "CC",
-            "CNC",
-            "CZ",
-            "CNZ",
-            "CP",
-            "CM",
-            "CPE",
-            "CPO",
-            "RC",
-            "RNC",
-            "RZ",
-            "RNZ",
-            "RP",
-            "RM",
-            "RPE",
-            "RPO",
-            "RST",
-            "CMP",
-            "NOP",
-            "SUI",
-            "IN",
-            "OUT",
-            "EI",
-            "DI",
-            "RIM",
-            "SIM",
-        ]
-
-        # Assembler directives
-        directives = ["DS", "ORG", "END", "EQU"]
-
-        # Create highlighting rules for instructions
-        for instruction in instructions:
-            pattern = QRegularExpression(
-                f"\\b{instruction}\\b", QRegularExpression.PatternOption.CaseInsensitiveOption
-            )
-            self.highlighting_rules.append((pattern, instruction_format))
-
-        # Create highlighting rules for directives
-        for directive in directives:
-            pattern = QRegularExpression(
-                f"\\b{directive}\\b", QRegularExpression.PatternOption.CaseInsensitiveOption
-            )
-            self.highlighting_rules.append((pattern, directive_format))
-
-        # Create highlighting rules for registers
-        registers = ["A", "B", "C", "D", "E", "H", "L", "M", "SP", "PSW"]
-
-        for reg in registers:
-            pattern = QRegularExpression(
-                f"\\b{reg}\\b", QRegularExpression.PatternOption.CaseInsensitiveOption
-            )
-            self.highlighting_rules.append((pattern, register_format))
-
-        # Highlighting rules for number formats
-        hex_pattern = QRegularExpression("\\b[0-9A-Fa-f]+[Hh]\\b")
-        self.highlighting_rules.append((hex_pattern, hex_format))
+        # Uppercased keyword -> format table shared by all three categories,
+        # probed once per token in highlightBlock
+        self._keyword_formats = {}
+        for words, fmt in (
+            (_INSTRUCTIONS, instruction_format),
+            (_DIRECTIVES, directive_format),
+            (_REGISTERS, register_format),
+        ):
+            for word in words:
+                self._keyword_formats[word] = fmt
 
-        decimal_pattern = QRegularExpression("\\b[0-9]+\\b(?![Hh])")
-        self.highlighting_rules.append((decimal_pattern, decimal_format))
+        self._comment_format = comment_format
+        self._label_format = label_format
+        self._hex_format = hex_format
+        self._decimal_format = decimal_format
 
-        # Highlighting rules for comments and labels
-        comment_pattern = QRegularExpression(";.*")
-        self.highlighting_rules.append((comment_pattern, comment_format))
+    def highlightBlock(self, text):
+        """Classify each token of a text block in a single scan and format it"""
+        set_format = self.setFormat
+
+        cache = AssemblyHighlighter._fmt_cache
+        spans = cache.get(text)
+        if spans is not None:
+            cache.move_to_end(text)
+            for start, length, format in spans:
+                set_format(start, length, format)
+            return
 
-        label_pattern = QRegularExpression("\\b[A-Za-z_][A-Za-z0-9_]*:")
-        self.highlighting_rules.append((label_pattern, label_format))
+        spans = []
+        keyword_formats = self._keyword_formats
+        for match in _TOKEN_RE.finditer(text):
+            token = match.group()
+            if token[0] == ";":
+                format = self._comment_format
+            elif token[-1] == ":":
+                format = self._label_format
+            elif token[0].isdigit():
+                if token.isdigit():
+                    format = self._decimal_format
+                elif _HEX_TOKEN_RE.fullmatch(token):
+                    format = self._hex_format
+                else:
+                    continue
+            else:
+                format = keyword_formats.get(token.upper())
+                if format is None:
+                    if _HEX_TOKEN_RE.fullmatch(token):
+                        format = self._hex_format
+                    else:
+                        continue
+            start = match.start()
+            length = len(token)
+            set_format(start, length, format)
+            spans.append((start, length, format))
 
-    def highlightBlock(self, text):
-        """Apply defined highlighting rules to each text block"""
-        for pattern, format in self.highlighting_rules:
-            match = pattern.globalMatch(text)
-            while match.hasNext():
-                match_result = match.next()
-                self.setFormat(
-                    match_result.capturedStart(), match_result.capturedLength(), format
-                )
+        cache[text] = spans
+        if len(cache) > AssemblyHighlighter._FMT_CACHE_MAX:
+            cache.popitem(last=False)
 
 
 class LineNumberedEditor(ZoomMixin, QPlainTextEdit):
@@ -444,7 +491,6 @@ class LineNumberedEditor(ZoomMixin, QPlainTextEdit):
     def __init__(self):
         super().__init__(font_point_size=12)
         self.setPlaceholderText("Enter 8085 Assembly Code Here...")
-        self.setFont(QFont("Consolas", 12))
 
         self.container = QWidget()
         self.container_layout = QVBoxLayout(self.container)
@@ -464,27 +510,6 @@ class LineNumberedEditor(ZoomMixin, QPlainTextEdit):
             selection-background-color: #0B91FF;
             selection-color: white;
         }
-        QScrollBar:vertical {
-            border: none;
-            background: #F0F0F0;
-            width: 10px;
-            margin: 0px;
-        }
-        QScrollBar::handle:vertical {
-            background: #AAAAAA;
-            min-height: 30px;
-        }
-        QScrollBar::handle:vertical:hover {
-            background: #888888;
-        }
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0px;
-            background: none;
-            border: none;
-        }
-        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-            background: none;
-        }
         """
         )
 
@@ -498,32 +523,69 @@ class LineNumberedEditor(ZoomMixin, QPlainTextEdit):
         self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.lineNumberArea = LineNumberArea(self)
         self.breakpoints = set()
+        self._suppress_current_line_highlight = False
+
+        # Prebuilt line number strings, rebuilt only when the source or the
+        # assembled line-to-address map changes
+        self._line_number_strings = []
+        self._line_number_cache_key = None
+
+        # Cached gutter width, invalidated when digit count, address-map
+        # presence, or font size changes
+        self._cached_lna_width = -1
+        self._cached_lna_key = None
+
+        # Coalesces bursts of cursor moves into one status/highlight update
+        self._cursor_dirty = False
 
         # Connect signals for UI updates
         self.blockCountChanged.connect(self.updateLineNumberAreaWidth)
         self.updateRequest.connect(self.updateLineNumberArea)
-        self.cursorPositionChanged.connect(self.updateCursorPosition)
-        self.cursorPositionChanged.connect(self.highlightCurrentLine)
+        self.cursorPositionChanged.connect(self._on_cursor_changed)
 
         self.updateLineNumberAreaWidth(0)
         self.highlightCurrentLine()
         self.updateCursorPosition()
 
+    def _on_cursor_changed(self):
+        """Schedule one deferred update for a burst of cursor-move signals"""
+        if self._suppress_current_line_highlight:
+            # Execution highlighting moves the cursor itself; update the
+            # status bar but leave the executed-line selection in place
+            self.updateCursorPosition()
+            return
+        if not self._cursor_dirty:
+            self._cursor_dirty = True
+            QTimer.singleShot(0, self._flush_cursor_state)
+
+    def _flush_cursor_state(self):
+        """Apply the coalesced status-bar and highlight updates once"""
+        if not self._cursor_dirty:
+            return
+        self._cursor_dirty = False
+        self.updateCursorPosition()
+        self.highlightCurrentLine()
+
     def updateCursorPosition(self):
         """Update status bar with current cursor position information"""
         cursor = self.textCursor()
         line = cursor.blockNumber() + 1
         col = cursor.columnNumber() + 1
-        chars = len(self.toPlainText())
+        # characterCount is O(1) but includes the trailing paragraph separator
+        chars = self.document().characterCount() - 1
 
         self.status_bar.setText(f"Ln {line}, Col {col}, Chars: {chars}")
 
     def lineNumberAreaWidth(self):
         """Calculate required width for line number display area"""
-        digits = len(str(self.blockCount())) + (2 if self.lineNumberArea.simulator is None
-                                                 or len(self.lineNumberArea.simulator.processor.line_to_address_map) == 0
-                                                   else 8)
-        return 15 + self.fontMetrics().horizontalAdvance("9") * digits
+        has_address_map = (self.lineNumberArea.simulator is not None
+                           and len(self.lineNumberArea.simulator.processor.line_to_address_map) > 0)
+        cache_key = (len(str(self.blockCount())), has_address_map, self.font().pointSize())
+        if cache_key != self._cached_lna_key:
+            digits = cache_key[0] + (8 if has_address_map else 2)
+            self._cached_lna_width = 15 + self.fontMetrics().horizontalAdvance("9") * digits
+            self._cached_lna_key = cache_key
+        return self._cached_lna_width
 
     def updateLineNumberAreaWidth(self, _):
         self.setViewportMargins(self.lineNumberAreaWidth(), 0, 0, 0)
@@ -547,40 +609,71 @@ class LineNumberedEditor(ZoomMixin, QPlainTextEdit):
             QRect(rect.left(), rect.top(), self.lineNumberAreaWidth(), rect.height())
         )
 
+    def lineNumberAreaStrings(self, line_count):
+        """Return the prebuilt line number strings, rebuilding them when the
+        line-to-address map or the number of lines has changed"""
+        line_to_address_map = (
+            {} if self.lineNumberArea.simulator is None
+            else self.lineNumberArea.simulator.processor.line_to_address_map
+        )
+        cache_key = (id(line_to_address_map), len(line_to_address_map), line_count)
+        if cache_key != self._line_number_cache_key:
+            if len(line_to_address_map) == 0:
+                strings = [str(n) for n in range(1, line_count + 1)]
+            else:
+                strings = [
+                    f"{n} {line_to_address_map[n]:04X}H" if n in line_to_address_map
+                    else f"{n}      "
+                    for n in range(1, line_count + 1)
+                ]
+            self._line_number_strings = strings
+            self._line_number_cache_key = cache_key
+        return self._line_number_strings
+
     def lineNumberAreaPaintEvent(self, event):
         """Render line numbers and breakpoint indicators in the line number area"""
+        event_rect = event.rect()
+        if event_rect.isEmpty():
+            return
+
         painter = QPainter(self.lineNumberArea)
-        painter.fillRect(event.rect(), QColor("#F0F0F0"))
+        painter.fillRect(event_rect, _LNA_BG)
 
-        block = self.firstVisibleBlock()
+        # Jump straight to the topmost block intersecting the update rect;
+        # partial repaints (cursor blink, breakpoint toggles) touch only a
+        # few lines
+        block = self.document().findBlock(
+            self.cursorForPosition(QPoint(0, event_rect.top())).position()
+        )
         blockNumber = block.blockNumber()
         top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
         bottom = top + self.blockBoundingRect(block).height()
 
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                line_to_address_map = self.lineNumberArea.simulator.processor.line_to_address_map
-                line_number = blockNumber + 1
-                number = (str(line_number) if len(line_to_address_map) == 0
-                          else
-                            (f"{line_number}      ") if line_number not in line_to_address_map
-                                else f"{line_number} {line_to_address_map[line_number]:04X}H")
-                painter.setPen(QColor("#6D6D6D"))
+        numbers = self.lineNumberAreaStrings(self.blockCount())
+        text_width = self.lineNumberArea.width() - 5
+        text_height = int(self.fontMetrics().height())
+        event_top = event_rect.top()
+        event_bottom = event_rect.bottom()
+        breakpoints = self.breakpoints
+
+        while block.isValid() and top <= event_bottom:
+            if block.isVisible() and bottom >= event_top:
+                painter.setPen(_LN_COLOR)
 
                 # Draw breakpoint marker
-                if blockNumber in self.breakpoints:
-                    painter.setPen(QColor("#DA0000"))
-                    painter.setBrush(QColor("#DA0000"))
+                if blockNumber in breakpoints:
+                    painter.setPen(_BP_COLOR)
+                    painter.setBrush(_BP_BRUSH)
                     painter.drawEllipse(3, int(top) + 4, 8, 8)
-                    painter.setPen(QColor("#6D6D6D"))
+                    painter.setPen(_LN_COLOR)
 
                 painter.drawText(
                     0,
                     int(top),
-                    self.lineNumberArea.width() - 5,
-                    int(self.fontMetrics().height()),
+                    text_width,
+                    text_height,
                     Qt.AlignmentFlag.AlignRight,
-                    number,
+                    numbers[blockNumber],
                 )
 
             block = block.next()
@@ -590,6 +683,8 @@ class LineNumberedEditor(ZoomMixin, QPlainTextEdit):
 
     def highlightCurrentLine(self):
         """Highlight the line containing the cursor"""
+        if self._suppress_current_line_highlight:
+            return
         extraSelections = []
         selection = QTextEdit.ExtraSelection()
         selection.format.setBackground(QColor("#E6F2FF"))
@@ -603,8 +698,10 @@ class LineNumberedEditor(ZoomMixin, QPlainTextEdit):
         """Highlight the currently executing line during simulation"""
         cursor = QTextCursor(self.document().findBlockByLineNumber(line))
 
-        # Temporarily disconnect to prevent interference
-        self.cursorPositionChanged.disconnect(self.highlightCurrentLine)
+        # Temporarily suppress the cursor-line highlight to prevent
+        # interference, and cancel any flush scheduled before this step
+        self._suppress_current_line_highlight = True
+        self._cursor_dirty = False
 
         # Create execution highlight with light purple background
         extraSelections = []
@@ -622,11 +719,7 @@ class LineNumberedEditor(ZoomMixin, QPlainTextEdit):
         self.setTextCursor(cursor)
         self.ensureCursorVisible()
 
-        # Force update to make the highlight visible immediately
-        QApplication.processEvents()
-
-        # Reconnect signal
-        self.cursorPositionChanged.connect(self.highlightCurrentLine)
+        self._suppress_current_line_highlight = False
 
     def toggleBreakpoint(self, line):
         """Toggle breakpoint state for the specified line"""
@@ -638,32 +731,38 @@ class LineNumberedEditor(ZoomMixin, QPlainTextEdit):
         # Refresh line number area display
         self.lineNumberArea.update()
 
-    def zoom_in(self):
-        """Zoom in"""
-        super().zoom_in()
-        self.lineNumberArea.zoom_in()
-
-    def zoom_out(self):
-        """Zoom out"""
-        super().zoom_out()
-        self.lineNumberArea.zoom_out()
-
-    def reset_zoom(self):
-        """Reset zoom"""
-        super().reset_zoom()
-        self.lineNumberArea.reset_zoom()
+    def apply_zoom(self, zoom_level):
+        """Apply the shared zoom level to the editor and its gutter"""
+        super().apply_zoom(zoom_level)
+        self.lineNumberArea.apply_zoom(zoom_level)
 
 class Simulator(QWidget):
     """Main simulator application for the 8085 microprocessor"""
 
+    zoomChanged = Signal(int)
+
+    # Oldest log lines are dropped past this bound, both in the widget and
+    # in the Python-side history
+    LOG_MAX_LINES = 1000
+
     def __init__(self):
         super().__init__()
         self.processor = Processor8085()
-        self.execution_log = []
+        # Bound reference to the processor's flat address-to-line table,
+        # rebound whenever the processor or its program changes
+        self._addr2line = self.processor.address_to_line_map
+        self.execution_log = deque(maxlen=self.LOG_MAX_LINES)
         self.execution_count = 0
         self.current_file = None
         self.user_memory_addr = 0x0000
         self.follow_pc = False
+        # Visible memory window snapshot used to diff refreshes
+        self._mem_view_base = None
+        self._mem_view_snapshot = None
+        # Shadow of displayed register values; labels only repaint on change
+        self._last_reg_values = {}
+        # Last highlighted (0-indexed) line; repeat highlights are skipped
+        self._last_highlight_line = None
         self.use_highlighting = True
         self.document_modified = False
 
@@ -672,6 +771,33 @@ class Simulator(QWidget):
         self.elapsed_time_ms = 0
         self.timer_running = False
 
+        # Refreshes the instruction-count and elapsed-time labels while a run
+        # is active, so the execution loop never repaints them per step
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(200)
+        self._stats_timer.timeout.connect(self._refresh_stats)
+
+        # Pending log lines, flushed to the widget in one append per interval
+        self._log_buffer = deque(maxlen=self.LOG_MAX_LINES)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # Coalesces editor textChanged bursts so the modified-flag update
+        # runs once per pause in typing instead of once per keystroke
+        self._doc_mod_timer = QTimer(self)
+        self._doc_mod_timer.setSingleShot(True)
+        self._doc_mod_timer.setInterval(150)
+        self._doc_mod_timer.timeout.connect(self.document_was_modified)
+
+        # Shared zoom level, broadcast to widgets via zoomChanged; the timer
+        # coalesces rapid shortcut presses into a single emission
+        self._zoom_level = 0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(50)
+        self._zoom_timer.timeout.connect(self._emit_zoom_changed)
+
         self.init_ui()
 
     def start_elapsed_timer(self):
@@ -680,6 +806,11 @@ class Simulator(QWidget):
             self.elapsed_timer.start()
             self.timer_running = True
 
+    def _refresh_stats(self):
+        """Update the run statistics labels from the current counters"""
+        self.instr_count_label.setText(f"Instructions: {self.execution_count}")
+        self.update_elapsed_time_display()
+
     def stop_elapsed_timer(self):
         """Stop execution timer and update elapsed time"""
         if self.timer_running:
@@ -793,39 +924,9 @@ class Simulator(QWidget):
         run_menu.addAction(stop_action)
         run_menu.addAction(reset_action)
 
-        # Debug Menu
-        debug_menu = self.menu_bar.addMenu("Debug")
-        add_bp_action = QAction("Add Breakpoint", self)
-        add_bp_action.setShortcut("F9")
-        add_bp_action.triggered.connect(self.add_breakpoint)
-        remove_bp_action = QAction("Remove Breakpoint", self)
-        remove_bp_action.triggered.connect(self.remove_breakpoint)
-        remove_all_bp_action = QAction("Remove All Breakpoints", self)
-        remove_all_bp_action.triggered.connect(self.remove_all_breakpoints)
-        debug_menu.addAction(add_bp_action)
-        debug_menu.addAction(remove_bp_action)
-        debug_menu.addAction(remove_all_bp_action)
-
-        # Zoom Menu
-        zoom_menu = self.menu_bar.addMenu("Zoom")
-        zoom_in_action = QAction("Zoom In", self)
-        zoom_in_action.setShortcut("Ctrl+=")
-        zoom_in_action.triggered.connect(self.zoom_in)
-        zoom_out_action = QAction("Zoom Out", self)
-        zoom_out_action.setShortcut("Ctrl+-")
-        zoom_out_action.triggered.connect(self.zoom_out)
-        reset_zoom_action = QAction("Reset Zoom", self)
-        reset_zoom_action.setShortcut("Ctrl+0")
-        reset_zoom_action.triggered.connect(self.reset_zoom)
-        zoom_menu.addAction(zoom_in_action)
-        zoom_menu.addAction(zoom_out_action)
-        zoom_menu.addAction(reset_zoom_action)
-
-        # Help Menu
-        help_menu = self.menu_bar.addMenu("Help")
-        about_action = QAction("About", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        # Debug, Zoom, and Help menus are built after the first event-loop
+        # turn so they don't delay the initial window paint
+        QTimer.singleShot(0, self._init_ui_deferred)
 
         main_layout.addWidget(self.menu_bar)
 
@@ -840,59 +941,10 @@ class Simulator(QWidget):
         # Left Panel - Code Editor and Execution Log
         left_panel = QVBoxLayout(left_part)
 
-        # Global styling
-        self.setStyleSheet(
-            """
-            QWidget {
-                background-color: #EDEDED;
-                color: #1E1E1E;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #F0F0F0;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #AAAAAA;
-                min-height: 30px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #888888;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-                background: none;
-                border: none;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-            QScrollBar:horizontal {
-                border: none;
-                background: #F0F0F0;
-                height: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #AAAAAA;
-                min-width: 30px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #888888;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-                background: none;
-                border: none;
-            }
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
-                background: none;
-            }
-        """
-        )
+        # Widget-specific styling; scrollbar rules live in the application
+        # stylesheet, and the repeated control-button and panel-label styles
+        # are object-name selectors here so Qt parses them once
+        self.setStyleSheet(_SIMULATOR_QSS)
 
         self.code_editor = LineNumberedEditor()
 
@@ -950,13 +1002,14 @@ class Simulator(QWidget):
         log_layout.addLayout(log_header_layout)
         
         # Execution log widget
-        self.execution_log_widget = TextEdit()
+        self.execution_log_widget = PlainTextEdit()
         self.execution_log_widget.setReadOnly(True)
+        self.execution_log_widget.setMaximumBlockCount(self.LOG_MAX_LINES)
         self.execution_log_widget.clear()
 
         self.execution_log_widget.setStyleSheet(
             """
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: white; 
                 color: #1E1E1E; 
                 padding: 5px;
@@ -986,6 +1039,30 @@ class Simulator(QWidget):
         """
         )
 
+        # Shared per-status character formats and a persistent end-of-document
+        # cursor; log flushes insert plain text with a preset format instead
+        # of building and parsing HTML per batch
+        self._log_formats = {}
+        for log_status, log_color in (
+            ("OK", "#00AA00"),  # Green
+            ("HALT", "#AAAA00"),  # Yellow
+            ("ERROR", "#AA0000"),  # Red
+            ("SYSTEM", "#00AAAA"),  # Cyan
+        ):
+            log_format = QTextCharFormat()
+            log_format.setForeground(QColor(log_color))
+            self._log_formats[log_status] = log_format
+        self._log_default_format = QTextCharFormat()
+        self._log_default_format.setForeground(QColor("white"))
+        self._log_cursor = QTextCursor(self.execution_log_widget.document())
+
+        # Autoscroll tracks whether the user is parked at the bottom of the
+        # log; scrolling up suspends it, returning to the bottom resumes it
+        self._log_autoscroll = True
+        self.execution_log_widget.verticalScrollBar().valueChanged.connect(
+            self._on_log_scrolled
+        )
+
         log_layout.addWidget(self.execution_log_widget, 1)
         log_converter_layout.addLayout(log_layout, 2)
 
@@ -1016,85 +1093,24 @@ class Simulator(QWidget):
         control_layout = QHBoxLayout()
 
         self.compile_button = PushButton("Assemble")
-        self.compile_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #458ADB; 
-                color: white; 
-                border: none; 
-                padding: 6px;
-            }
-            QPushButton:hover {
-                background-color: #3A75C4;
-            }
-        """
-        )
+        self.compile_button.setObjectName("assembleBtn")
         self.compile_button.clicked.connect(self.compile_program)
-
-        self.step_button = PushButton("Step")
-        self.step_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #B8A404; 
-                color: white; 
-                border: none; 
-                padding: 6px;
-            }
-            QPushButton:hover {
-                background-color: #9E8C03;
-            }
-        """
-        )
-        self.step_button.clicked.connect(self.execute_single_step)
-
-        self.run_button = PushButton("Run")
-        self.run_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #0DB000; 
-                color: white; 
-                border: none; 
-                padding: 6px;
-            }
-            QPushButton:hover {
-                background-color: #0A9000;
-            }
-        """
-        )
+
+        self.step_button = PushButton("Step")
+        self.step_button.setObjectName("stepBtn")
+        self.step_button.clicked.connect(self.execute_single_step)
+
+        self.run_button = PushButton("Run")
+        self.run_button.setObjectName("runBtn")
         self.run_button.clicked.connect(self.start_continuous_execution)
 
         self.stop_button = PushButton("Stop")
-        self.stop_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #C42B1C; 
-                color: white; 
-                border: none; 
-                padding: 6px;
-            }
-            QPushButton:hover {
-                background-color: #A82318;
-            }
-        """
-        )
+        self.stop_button.setObjectName("stopBtn")
         self.stop_button.clicked.connect(self.stop_execution)
         self.stop_button.setEnabled(False)
 
         self.reset_button = PushButton("Reset")
-        self.reset_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: white; 
-                color: #1E1E1E; 
-                border: 2px solid #DDDDDD; 
-                padding: 6px;
-            }
-            QPushButton:hover {
-                background-color: #F0F0F0;
-                border: 2px solid #BBBBBB;
-            }
-        """
-        )
+        self.reset_button.setObjectName("resetBtn")
         self.reset_button.clicked.connect(self.reset_simulation)
 
         control_layout.addWidget(self.compile_button)
@@ -1234,14 +1250,10 @@ class Simulator(QWidget):
         stats_layout = QHBoxLayout()
 
         self.instr_count_label = Label("Instructions: 0", font_family="Segoe UI", font_point_size=10)
-        self.instr_count_label.setStyleSheet(
-            "background-color: white; color: #1E1E1E; padding: 5px; border: 1px solid #DDDDDD;"
-        )
+        self.instr_count_label.setObjectName("panelLabel")
 
         self.exec_time_label = Label("Elapsed Time: 0 ms", font_family="Segoe UI", font_point_size=10)
-        self.exec_time_label.setStyleSheet(
-            "background-color: white; color: #1E1E1E; padding: 5px; border: 1px solid #DDDDDD;"
-        )
+        self.exec_time_label.setObjectName("panelLabel")
 
         stats_layout.addWidget(self.instr_count_label)
         stats_layout.addWidget(self.exec_time_label)
@@ -1271,133 +1283,80 @@ class Simulator(QWidget):
         self.load_memory_display(0x0000)
 
         # Set code editor with sample program
-        self.code_editor.setPlainText(
-            rf"""; +===================================================================+
-;     _   __           ____  ____  ____  ______
-;    / | / /__  ____  ( __ )/ __ \( __ )/ ____/
-;   /  |/ / _ \/ __ \/ __  / / / / __  /___ \  
-;  / /|  /  __/ /_/ / /_/ / /_/ / /_/ /___/ /  
-; /_/ |_/\___/\____/\____/\____/\____/_____/  
-;
-; Version: {display_version}
-;
-; Copyright 2026 (c) Shahibur Rahaman
-; Licensed under GNU GPL v3.0
-;
-; +==================================================================+
-; |       Welcome to Neo8085 - 8085 Microprocessor Simulator         |
-; +==================================================================+
-;
-; SIMULATOR USAGE INSTRUCTIONS:
-; ----------------------------
-; 1. EDITING & SAVING:
-;    - Type your assembly code in this editor
-;    - Save/Open files using File menu or Ctrl+S / Ctrl+O
-;    - Modified files show an asterisk (*) in the title bar
-;
-; 2. ASSEMBLING & EXECUTION:
-;    - Click "Assemble
-;    - "Step" (F10) to execute one instruction at a time
-;    - "Run" (F5) to execute continuously with highlighting
-;    - "Fast mode" (Ctrl+Shift+F5) to execute at higher speed without highlighting
-;    - "Stop" (F8) to pause continuous execution
-;    - "Reset" to clear processor state and memory
-;
-; 3. DEBUGGING FEATURES:
-;    - Add breakpoints by clicking in the line number margin
-;    - Or use F9 to add a breakpoint at the current line
-;    - Use the Memory Editor to modify memory
-;    - Use Memory table view to inspect and analyze the memory during execution
-;    - Follow PC button (toggle) tracks the Program Counter in memory
-;
-; 4. DIRECTIVE USAGE:
-;    - ORG: Set starting address - e.g., "ORG 2000H"
-;    - EQU: Define constants (supports arithmetic operations too) - e.g., "COUNT: EQU 5 * 5"
-;    - DS: Reserve memory space - e.g., "BUFFER: DS 10" 
-;    - END: A Placeholder representing the logical end of the progam
-;    - NOTE! Use JUMP instructions before "DS" directives to prevent no instruction found error. 
-;
-; EXAMPLE PROGRAM BELOW DEMONSTRATES:
-; - EQU nested directives with arithmetic
-; - Memory operations
-; - Register manipulation
-; - Program logic and looping
-; +===================================================================+
-;
-; ===================================================================
-;              FIBONACCI SERIES CALCULATION AND STORAGE
-; ===================================================================
-
-; - After assembling the code use the memory table view's search field
-;   to locate the loaded program (e.g., 2000H for our example program).
-; - Use "Follow PC" (toggle) to easily locate the current row of memory
-;   that is being executed (16 bytes per row). 
-
-ORG 2000H		; Due to presence of 'H' suffix this is treated as HEX value
-
-JMP START
-
-FIRST_ELEMENT:	EQU 0	; Treated as DECIMAL value due to lack of 'H' suffix
-SECOND_ELEMENT:	EQU 1	; Treated as DECIMAL value due to lack of 'H' suffix
-ELEMENTS_COUNT: 	EQU 0AH  ; 10 ELEMENTS (Treated as HEX value due to presence of 'H' suffix)
-LOOP_COUNTER:	EQU ELEMENTS_COUNT - 1 ; FIRST ONE ELEMENT IS NOT NEEDED FOR LOOPING
-
-; RESERVING MEMORY SPACE FOR STORING FIBONACCI SERIES
-DATA_AREA: DS ELEMENTS_COUNT
-
-START:	JMP FIBONACCI_SERIES_SETUP	; Jump to the respective label
-
-FIBONACCI_SERIES_SETUP:
-	MVI A, FIRST_ELEMENT
-	MVI B, SECOND_ELEMENT
-	MVI D, LOOP_COUNTER
-	LXI H, DATA_AREA
-	MOV M, A		; STORING THE FIRST ELEMENT IN MEMORY
-	INX H		; INCREASING MEMORY ADDRESS REGISTER VALUE (H-L REGISTER PAIR)
-	JMP FIBONACCI_CALC_LOOP
-
-FIBONACCI_CALC_LOOP:
-	MOV C, A
-	ADD B
-	MOV B, C
-	DCR D		; DECREASE THE VALUE OF THE LOOP COUNTER REGISTER
-	MOV M, A
-	INX H
-	JNZ FIBONACCI_CALC_LOOP
-	JMP END_OF_PROGRAM
-
-END_OF_PROGRAM:
-	HLT
-
-END
+        self.code_editor.setPlainText(_sample_program())
+
+        # Connect to the textChanged signal of the code editor, debounced
+        # through the single-shot modification timer
+        self.code_editor.textChanged.connect(self._doc_mod_timer.start)
+
+        # Subscribe every zoomable widget to the shared zoom signal once
+        self.zoomChanged.connect(self.menu_bar.apply_zoom)
+        self.zoomChanged.connect(self.code_editor.apply_zoom)
+        self.zoomChanged.connect(self.execution_log_widget.apply_zoom)
+        self.zoomChanged.connect(self.memory_table.apply_zoom)
+        for widget_class in (PushButton, Label, LineEdit):
+            for widget in self.findChildren(widget_class):
+                self.zoomChanged.connect(widget.apply_zoom)
+
+    def _init_ui_deferred(self):
+        """Build the non-essential menus after the first event-loop turn"""
+        # Debug Menu
+        debug_menu = self.menu_bar.addMenu("Debug")
+        add_bp_action = QAction("Add Breakpoint", self)
+        add_bp_action.setShortcut("F9")
+        add_bp_action.triggered.connect(self.add_breakpoint)
+        remove_bp_action = QAction("Remove Breakpoint", self)
+        remove_bp_action.triggered.connect(self.remove_breakpoint)
+        remove_all_bp_action = QAction("Remove All Breakpoints", self)
+        remove_all_bp_action.triggered.connect(self.remove_all_breakpoints)
+        debug_menu.addAction(add_bp_action)
+        debug_menu.addAction(remove_bp_action)
+        debug_menu.addAction(remove_all_bp_action)
 
-"""
-        )
+        # Zoom Menu
+        zoom_menu = self.menu_bar.addMenu("Zoom")
+        zoom_in_action = QAction("Zoom In", self)
+        zoom_in_action.setShortcut("Ctrl+=")
+        zoom_in_action.triggered.connect(self.zoom_in)
+        zoom_out_action = QAction("Zoom Out", self)
+        zoom_out_action.setShortcut("Ctrl+-")
+        zoom_out_action.triggered.connect(self.zoom_out)
+        reset_zoom_action = QAction("Reset Zoom", self)
+        reset_zoom_action.setShortcut("Ctrl+0")
+        reset_zoom_action.triggered.connect(self.reset_zoom)
+        zoom_menu.addAction(zoom_in_action)
+        zoom_menu.addAction(zoom_out_action)
+        zoom_menu.addAction(reset_zoom_action)
 
-        # Connect to the textChanged signal of the code editor
-        self.code_editor.textChanged.connect(self.document_was_modified)
+        # Help Menu
+        help_menu = self.menu_bar.addMenu("Help")
+        about_action = QAction("About", self)
+        about_action.triggered.connect(self.show_about)
+        help_menu.addAction(about_action)
 
     def add_register(self, name, row, col, rowspan=1, colspan=1):
         """Add a register display to the UI"""
         value = "00H" if name not in ["SP", "PC", "PSW"] else "0000H"
         label = Label(f"{name}: {value}")
-        label.setStyleSheet(
-            "background-color: white; color: #1E1E1E; padding: 5px; border: 1px solid #DDDDDD;"
-        )
+        label.setObjectName("panelLabel")
         label.setAlignment(Qt.AlignCenter)
         self.registers_grid.addWidget(label, row, col, rowspan, colspan)
         self.register_labels[name] = label
 
     def update_registers_display(self):
         """Update register display from processor state"""
+        last_values = self._last_reg_values
         for reg, value in self.processor.registers.items():
-            if reg in self.register_labels:
-                # Format the value based on register type
-                if reg in ["SP", "PC"]:
-                    hex_value = f"{value:04X}H"
-                else:
-                    hex_value = f"{value:02X}H"
-                self.register_labels[reg].setText(f"{reg}: {hex_value}")
+            label = self.register_labels.get(reg)
+            if label is None or last_values.get(reg) == value:
+                continue
+            last_values[reg] = value
+            # Format the value based on register type
+            if reg in ["SP", "PC"]:
+                hex_value = _HEX2[value >> 8] + _HEX2[value & 0xFF] + "H"
+            else:
+                hex_value = _HEX2[value] + "H"
+            label.setText(f"{reg}: {hex_value}")
 
         # Update flags display from processor state
         self.flags_group.update_display()
@@ -1406,7 +1365,9 @@ END
         # Update PSW display - combining A register and flags
         if "PSW" in self.register_labels:
             psw_value = self.processor.get_psw()
-            self.register_labels["PSW"].setText(f"PSW: {psw_value:04X}H")
+            if last_values.get("PSW") != psw_value:
+                last_values["PSW"] = psw_value
+                self.register_labels["PSW"].setText(f"PSW: {psw_value:04X}H")
 
     def start_fast_execution(self):
         """Start continuous execution mode without code highlighting for better performance"""
@@ -1429,12 +1390,18 @@ END
             self.set_status("Program halted - Reset to run again", "warning")
             return
 
-        # Start elapsed timer
+        # Start elapsed timer and periodic stats refresh
         self.start_elapsed_timer()
+        self._stats_timer.start()
 
-        # Continue with normal execution if not halted
+        # Continue with normal execution if not halted; fast mode runs a
+        # batch of instructions per tick instead of one
         self.running = True
-        self.execution_timer.start(10)  # Execute faster - every 10ms instead of 50ms
+        self.execution_timer.timeout.disconnect()
+        self.execution_timer.timeout.connect(self._execute_fast_batch)
+        # Zero-interval timer: each tick runs a time-budgeted batch, then
+        # yields to the event loop so the UI stays responsive
+        self.execution_timer.start(0)
 
         # Update UI state
         self.compile_button.setEnabled(False)
@@ -1446,6 +1413,75 @@ END
 
         self.add_to_log("Fast execution started (no highlighting)", "SYSTEM")
 
+    # CPU budget per fast-mode tick; the deadline check runs every
+    # FAST_CHECK_INTERVAL instructions so the clock read stays off the
+    # per-instruction path
+    FAST_TICK_BUDGET = 0.008
+    FAST_CHECK_INTERVAL = 256
+
+    def _execute_fast_batch(self):
+        """Execute instructions for one time slice, then yield to the event loop"""
+        processor = self.processor
+        step = processor.step
+        registers = processor.registers
+        address_to_line_map = self._addr2line
+        breakpoints = self.code_editor.breakpoints
+        monotonic = time.monotonic
+
+        result = "OK"
+        last_pc = registers["PC"]
+        breakpoint_line = None
+        deadline = monotonic() + self.FAST_TICK_BUDGET
+        countdown = self.FAST_CHECK_INTERVAL
+        while True:
+            if processor.halted:
+                result = "HALT"
+                break
+            last_pc = registers["PC"]
+            if breakpoints:
+                # PC can step past the top of memory; treat that as no line
+                line_num = address_to_line_map[last_pc] if last_pc < 0x10000 else -1
+                if line_num >= 0 and (line_num - 1) in breakpoints:
+                    breakpoint_line = line_num
+                    break
+            result = step()
+            self.execution_count += 1
+            if result != "OK":
+                break
+            countdown -= 1
+            if countdown == 0:
+                if monotonic() >= deadline:
+                    break
+                countdown = self.FAST_CHECK_INTERVAL
+
+        # One UI refresh for the whole batch, coalesced into a single repaint;
+        # the stats labels are handled by the slower stats timer
+        self.setUpdatesEnabled(False)
+        try:
+            self.update_registers_display()
+            self.update_memory_view()
+        finally:
+            self.setUpdatesEnabled(True)
+
+        if breakpoint_line is not None:
+            self.add_to_log(f"Breakpoint hit at line {breakpoint_line}", "SYSTEM")
+            self.stop_execution()
+            # Always highlight on breakpoint hit, even in fast mode
+            self.code_editor.highlightExecutedLine(
+                breakpoint_line - 1
+            )  # Convert to 0-indexed for highlighting
+            return
+
+        if self.processor.last_instruction and result != "OK":
+            self.add_to_log(f"{last_pc:04X}: {self.processor.last_instruction}", result)
+
+        if result == "HALT":
+            self.set_status("Program halted", "warning")
+            self.stop_execution()
+        elif result == "ERROR":
+            self.set_status(f"Error: {self.processor.error}", "error")
+            self.stop_execution()
+
     def parse_address(self, addr_text):
         """Parse address text using 8085 conventions.
         - With 'H' or 'h' suffix: hexadecimal
@@ -1453,7 +1489,7 @@ END
         Returns the parsed integer address.
         """
         addr_text = addr_text.strip()
-        if addr_text.upper().endswith("H"):
+        if addr_text.endswith(("H", "h")):
             # Hex address
             try:
                 return int(addr_text[:-1], 16)
@@ -1471,23 +1507,46 @@ END
         # Address is aligned to 16-byte boundary
         base_addr = base_addr & 0xFFF0
 
+        memory = self.processor.memory if hasattr(self.processor, "memory") else None
+        window = bytes(memory[base_addr:base_addr + 256]) if memory is not None else bytes(256)
+        cells = self.memory_table.cells
+
+        if base_addr == self._mem_view_base:
+            snapshot = self._mem_view_snapshot
+            if window == snapshot:
+                # Nothing in the visible window changed
+                return
+
+            # Same window: update only the bytes that differ from the snapshot
+            self.memory_table.setUpdatesEnabled(False)
+            self.memory_table.blockSignals(True)
+            for i, value in enumerate(window):
+                if value != snapshot[i]:
+                    cells[i >> 4][(i & 0xF) + 2].setText(_HEX2[value])
+            self.memory_table.blockSignals(False)
+            self.memory_table.setUpdatesEnabled(True)
+            self._mem_view_snapshot = window
+            return
+
+        # New window: update the pre-created items in place with repaints and
+        # signals suspended for the duration of the batch
+        self.memory_table.setUpdatesEnabled(False)
+        self.memory_table.blockSignals(True)
         for row in range(16):
             row_addr = base_addr + (row * 16)
-            # Set decimal address
-            self.memory_table.setItem(row, 0, QTableWidgetItem(f"{row_addr}"))
-            # Set hex address
-            self.memory_table.setItem(row, 1, QTableWidgetItem(f"{row_addr:04X}H"))
+            row_cells = cells[row]
+            # Decimal and hex addresses
+            row_cells[0].setText(f"{row_addr}")
+            row_cells[1].setText(f"{row_addr:04X}H")
 
+            row_window = window[row * 16:(row + 1) * 16]
             for col in range(16):
-                addr = row_addr + col
-                value = (
-                    self.processor.memory[addr]
-                    if hasattr(self.processor, "memory")
-                    else 0
-                )
-                self.memory_table.setItem(
-                    row, col + 2, QTableWidgetItem(f"{value:02X}")
-                )
+                row_cells[col + 2].setText(_HEX2[row_window[col]])
+        self.memory_table.blockSignals(False)
+        self.memory_table.setUpdatesEnabled(True)
+
+        self._mem_view_base = base_addr
+        self._mem_view_snapshot = window
 
     def load_memory_address(self):
         """Jump to a specific memory address in the memory view"""
@@ -1537,7 +1596,7 @@ END
             return
 
         # Check if it's a decimal number or hex (with H/h suffix)
-        if text.upper().endswith("H"):
+        if text.endswith(("H", "h")):
             # Handle hex input
             hex_val = text[:-1]
             try:
@@ -1569,14 +1628,25 @@ END
             # Load the assembled program into the processor
             self.processor = Processor8085()
             self.processor.load_program(assembly_output)
+            self._addr2line = self.processor.address_to_line_map
+            self._last_highlight_line = None
 
             # Update UI
             self.update_registers_display()
             self.code_editor.updateLineNumberAreaWidth(0)
             # By setting the text to ORG address we are allowing the user to
-            # switch between Follow PC or ORG easily
-            self.memory_search.setText(f"{assembly_output.starting_address:04X}H")
-            self.memory_enter_button.click()
+            # switch between Follow PC or ORG easily; the view is loaded
+            # directly instead of round-tripping through the Enter button's
+            # click signal and re-parsing the address it was just formatted from
+            base_addr = assembly_output.starting_address
+            self.memory_search.setText(f"{base_addr:04X}H")
+            if base_addr > 0xFF00:
+                base_addr = 0xFF00  # Show the last complete memory page
+            self.user_memory_addr = base_addr
+            self.follow_pc = False
+            self.follow_pc_button.setChecked(False)
+            self.load_memory_display(base_addr)
+            self.add_to_log(f"Viewing memory at {base_addr:04X}H (hex)", "SYSTEM")
 
             self.add_to_log("Program assembled successfully", "SYSTEM")
             self.add_to_log("Machine code loaded into memory", "SYSTEM")
@@ -1632,9 +1702,12 @@ END
                 self.stop_execution()
             return "HALT"
 
-        # Get last PC and find corresponding line
+        # Get last PC and find corresponding line; PC can step past the top
+        # of memory, which has no line
         last_pc = self.processor.registers["PC"]
-        last_line_num = self.processor.address_to_line_map.get(last_pc)
+        last_line_num = self._addr2line[last_pc] if last_pc < 0x10000 else -1
+        if last_line_num < 0:
+            last_line_num = None
 
         # Check for breakpoints when running continuously
         if (
@@ -1654,28 +1727,33 @@ END
         # Execute one instruction
         result = self.processor.step()
 
-        self.highlight_current_instruction()
-
-        # Update execution count
-        self.execution_count += 1
-        self.instr_count_label.setText(f"Instructions: {self.execution_count}")
+        # Suspend repaints so the whole post-step refresh coalesces into a
+        # single paint event instead of one per widget
+        self.setUpdatesEnabled(False)
+        try:
+            self.highlight_current_instruction()
 
-        # Update elapsed time display
-        self.update_elapsed_time_display()
+            # Update execution count; during continuous runs the stats timer
+            # repaints the labels, so the hot path only bumps the counter
+            self.execution_count += 1
 
-        # When running in single-step mode, stop the timer after each step
-        if not hasattr(self, "running") or not self.running:
-            self.stop_elapsed_timer()
+            # When running in single-step mode, stop the timer after each
+            # step and refresh the stats labels immediately
+            if not hasattr(self, "running") or not self.running:
+                self.stop_elapsed_timer()
+                self._refresh_stats()
 
-        # Log the instruction that was executed - only in normal mode or for important events
-        if self.processor.last_instruction and (
-                self.use_highlighting or result != "OK"
-        ):
-            self.add_to_log(f"{last_pc:04X}: {self.processor.last_instruction}", result)
+            # Log the instruction that was executed - only in normal mode or for important events
+            if self.processor.last_instruction and (
+                    self.use_highlighting or result != "OK"
+            ):
+                self.add_to_log(f"{last_pc:04X}: {self.processor.last_instruction}", result)
 
-        # Update UI components
-        self.update_registers_display()
-        self.update_memory_view()
+            # Update UI components
+            self.update_registers_display()
+            self.update_memory_view()
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Check execution status
         if result == "HALT":
@@ -1690,15 +1768,20 @@ END
 
     def highlight_current_instruction(self):
         """Highlight current instruction"""
-        # Get current PC and find corresponding line
+        # Get current PC and find corresponding line; PC can step past the
+        # top of memory, which has no line
         cuurent_pc = self.processor.registers["PC"]
-        line_num = self.processor.address_to_line_map.get(cuurent_pc)
+        line_num = self._addr2line[cuurent_pc] if cuurent_pc < 0x10000 else -1
+        if line_num < 0:
+            line_num = None
 
-        # Highlight the current line before executing (only if highlighting is enabled)
+        # Highlight the current line before executing (only if highlighting is
+        # enabled and execution moved to a different line)
         if self.use_highlighting and line_num is not None:
-            self.code_editor.highlightExecutedLine(
-                line_num - 1
-            )  # Convert to 0-indexed for highlighting
+            line_index = line_num - 1  # Convert to 0-indexed for highlighting
+            if line_index != self._last_highlight_line:
+                self._last_highlight_line = line_index
+                self.code_editor.highlightExecutedLine(line_index)
 
     def start_continuous_execution(self):
         """Start continuous execution mode"""
@@ -1721,11 +1804,14 @@ END
         # Set the highlighting flag to True for normal execution
         self.use_highlighting = True
 
-        # Start elapsed timer
+        # Start elapsed timer and periodic stats refresh
         self.start_elapsed_timer()
+        self._stats_timer.start()
 
         # Continue with normal execution if not halted
         self.running = True
+        self.execution_timer.timeout.disconnect()
+        self.execution_timer.timeout.connect(self.execute_single_step)
         self.execution_timer.start(50)  # Execute every 50ms
 
         # Update UI state
@@ -1743,11 +1829,14 @@ END
         self.running = False
         self.execution_timer.stop()
 
-        # Stop elapsed timer
+        # Stop elapsed timer and stats refresh, showing the final totals
         self.stop_elapsed_timer()
+        self._stats_timer.stop()
+        self._refresh_stats()
 
         # Reset to default highlighting mode
         self.use_highlighting = True
+        self._last_highlight_line = None
 
         # Update UI state
         self.compile_button.setEnabled(True)
@@ -1759,6 +1848,9 @@ END
             self.set_status("Execution Paused", "warning")
             self.add_to_log("Execution paused", "SYSTEM")
 
+        # Show any buffered lines immediately now that execution stopped
+        self._flush_log()
+
     def update_memory_view(self):
         """Update memory view based on current state"""
         pc = self.processor.registers["PC"]
@@ -1784,15 +1876,9 @@ END
             else:
                 base_addr = int(base_addr_text, 16)
 
-            # Update only the memory values (columns 2-17), not the address columns
-            for row in range(16):
-                row_addr = base_addr + (row * 16)
-
-                for col in range(16):
-                    addr = row_addr + col
-                    value = self.processor.memory[addr]
-                    # Update memory value column (col+2 since columns 0,1 are addresses)
-                    self.memory_table.item(row, col + 2).setText(f"{value:02X}")
+            # Diffed against the window snapshot, so unchanged bytes cost
+            # nothing and the address columns are left alone
+            self.load_memory_display(base_addr)
         except (ValueError, AttributeError) as e:
             # Handle case where table might not be fully initialized yet
             self.add_to_log(f"Memory view update error: {str(e)}", "ERROR")
@@ -1846,30 +1932,44 @@ END
         """Add a message to the execution log"""
         timestamp = QDateTime.currentDateTime().toString("hh:mm:ss")
 
-        # Set color based on status
-        status_color = {
-            "OK": "#00AA00",  # Green
-            "HALT": "#AAAA00",  # Yellow
-            "ERROR": "#AA0000",  # Red
-            "SYSTEM": "#00AAAA",  # Cyan
-        }.get(status, "white")
-
-        # Format the log entry with HTML
-        log_entry = f"<span style='color:{status_color}'>[{timestamp}] {message}</span>"
+        # Pair the entry with the shared format for its status
+        log_entry = f"[{timestamp}] {message}"
+        log_format = self._log_formats.get(status, self._log_default_format)
 
-        # Add to the log and update display
+        # Buffer the entry; the log timer batches bursts into one insert
         self.execution_log.append(log_entry)
-        self.execution_log_widget.setHtml(
-            "<br>".join(self.execution_log[-100:])
-        )  # Show last 100 entries
-
-        # Scroll to the bottom
-        self.execution_log_widget.verticalScrollBar().setValue(
-            self.execution_log_widget.verticalScrollBar().maximum()
-        )
+        self._log_buffer.append((log_entry, log_format))
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Write buffered log lines to the widget in a single pass"""
+        self._log_timer.stop()
+        if not self._log_buffer:
+            return
+        document = self.execution_log_widget.document()
+        cursor = self._log_cursor
+        cursor.movePosition(QTextCursor.End)
+        for entry, entry_format in self._log_buffer:
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(entry, entry_format)
+        self._log_buffer.clear()
+
+        # Keep the view pinned to the newest entry unless the user scrolled up
+        if self._log_autoscroll:
+            scrollbar = self.execution_log_widget.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _on_log_scrolled(self, value):
+        """Suspend log autoscroll while the user is away from the bottom"""
+        scrollbar = self.execution_log_widget.verticalScrollBar()
+        self._log_autoscroll = value >= scrollbar.maximum()
 
     def clear_execution_log(self):
         """Clear execution log"""
+        self._log_timer.stop()
+        self._log_buffer.clear()
         self.execution_log.clear()
         self.execution_log_widget.clear()
 
@@ -1927,6 +2027,7 @@ END
                 f.write(self.code_editor.toPlainText())
 
             self.current_file = file_path
+            self._doc_mod_timer.stop()  # Discard pending modification marks
             self.document_modified = False  # Reset modified flag after saving
             self.update_window_title()
             self.add_to_log(f"Program saved to {file_path}", "SYSTEM")
@@ -1955,6 +2056,7 @@ END
 
                 self.code_editor.setPlainText(content)
                 self.current_file = file_path
+                self._doc_mod_timer.stop()  # Discard pending modification marks
                 self.document_modified = False  # Reset modified flag after loading
                 self.update_window_title()
                 self.add_to_log(f"Program loaded from {file_path}", "SYSTEM")
@@ -1978,6 +2080,7 @@ END
         self.code_editor.setPlainText("")
         self.reset_simulation()
         self.current_file = None
+        self._doc_mod_timer.stop()  # Discard pending modification marks
         self.document_modified = False  # Reset modified flag for new file
         self.update_window_title()
         self.add_to_log("New file created", "SYSTEM")
@@ -2002,42 +2105,24 @@ END
 
     def zoom_in(self):
         """Zoom in"""
-        self.menu_bar.zoom_in()
-        self.code_editor.zoom_in()
-        self.execution_log_widget.zoom_in()
-        self.memory_table.zoom_in()
-        for button in self.findChildren(PushButton):
-            button.zoom_in()
-        for label in self.findChildren(Label):
-            label.zoom_in()
-        for line_edit in self.findChildren(LineEdit):
-            line_edit.zoom_in()
+        self._zoom_level += 1
+        self._zoom_timer.start()
 
     def zoom_out(self):
         """Zoom out"""
-        self.menu_bar.zoom_out()
-        self.code_editor.zoom_out()
-        self.execution_log_widget.zoom_out()
-        self.memory_table.zoom_out()
-        for button in self.findChildren(PushButton):
-            button.zoom_out()
-        for label in self.findChildren(Label):
-            label.zoom_out()
-        for line_edit in self.findChildren(LineEdit):
-            line_edit.zoom_out()
+        # -8 keeps every widget at or above its minimum readable size
+        if self._zoom_level > -8:
+            self._zoom_level -= 1
+        self._zoom_timer.start()
 
     def reset_zoom(self):
         """Reset zoom"""
-        self.menu_bar.reset_zoom()
-        self.code_editor.reset_zoom()
-        self.execution_log_widget.reset_zoom()
-        self.memory_table.reset_zoom()
-        for button in self.findChildren(PushButton):
-            button.reset_zoom()
-        for label in self.findChildren(Label):
-            label.reset_zoom()
-        for line_edit in self.findChildren(LineEdit):
-            line_edit.reset_zoom()
+        self._zoom_level = 0
+        self._zoom_timer.start()
+
+    def _emit_zoom_changed(self):
+        """Broadcast the coalesced zoom level to subscribed widgets"""
+        self.zoomChanged.emit(self._zoom_level)
 
     def show_about(self):
         """Show about dialog"""
@@ -2062,6 +2147,7 @@ END
 
         # Create new processor instance
         self.processor = Processor8085()
+        self._addr2line = self.processor.address_to_line_map
 
         # Reset UI elements
         self.update_registers_display()
@@ -2091,30 +2177,11 @@ END
         text (str): The status message to display
         status_type (str): One of 'normal', 'success', 'warning', 'error'
         """
-        # Set the text
+        # Set the text and apply the prebuilt style for the status type
         self.status_label.setText(text)
-
-        # Common styling properties
-        base_style = """
-            background-color: {bg_color};
-            color: #1E1E1E; 
-            padding: 4px; 
-            border: 1px solid #DDDDDD;
-            border-radius: 3px;
-        """
-
-        # Choose background color based on status type
-        bg_colors = {
-            "normal": "white",  # White for normal/ready states
-            "success": "#DFF6DD",  # Light green for success/compile/run states
-            "warning": "#FFF4CE",  # Light yellow for warning/halt/pause states
-            "error": "#FDE7E9",  # Light red for error states
-        }
-
-        bg_color = bg_colors.get(status_type, "white")
-
-        # Apply the style
-        self.status_label.setStyleSheet(base_style.format(bg_color=bg_color))
+        self.status_label.setStyleSheet(
+            _STATUS_STYLES.get(status_type, _STATUS_STYLES["normal"])
+        )
 
     def toggle_follow_pc(self):
         """Toggle whether memory view should follow PC"""
@@ -2341,8 +2408,7 @@ END
             if hasattr(
                     self.processor, "is_program_memory"
             ) and self.processor.is_program_memory(address):
-                start_addr = min(self.processor.program_memory_range) if self.processor.program_memory_range else 0
-                end_addr = max(self.processor.program_memory_range) if self.processor.program_memory_range else 0
+                start_addr, end_addr = self.processor.program_memory_bounds()
                 self.add_to_log(
                     f"Cannot modify program memory at {address:04X}H ({start_addr:04X}H-{end_addr:04X}H)",
                     "ERROR",
@@ -2370,7 +2436,7 @@ END
                         row < self.memory_table.rowCount()
                         and col < self.memory_table.columnCount()
                 ):
-                    self.memory_table.item(row, col).setText(f"{value:02X}")
+                    self.memory_table.item(row, col).setText(_HEX2[value])
 
             # Log with appropriate format
             if addr_text.upper().endswith("H"):
@@ -2455,23 +2521,11 @@ class Flags(QWidget):
                 self.flags[flag].setStyleSheet(f"background-color: black; color: {"lightgreen" if value == 1 else "grey" }; border: 1px solid #DDDDDD;")
                 self.flags[flag].update()
 
-    def zoom_in(self):
-        """Zoom in"""
-        self.header.zoom_in()
-        for flag in self.flags:
-            self.flags[flag].zoom_in()
-
-    def zoom_out(self):
-        """Zoom out"""
-        self.header.zoom_out()
-        for flag in self.flags:
-            self.flags[flag].zoom_out()
-
-    def reset_zoom(self):
-        """Reset zoom"""
-        self.header.reset_zoom()
+    def apply_zoom(self, zoom_level):
+        """Apply the shared zoom level to the header and flag labels"""
+        self.header.apply_zoom(zoom_level)
         for flag in self.flags:
-            self.flags[flag].reset_zoom()
+            self.flags[flag].apply_zoom(zoom_level)
 
 
 class Stack(QGridLayout):
@@ -2484,9 +2538,7 @@ class Stack(QGridLayout):
         self.mem_locations: list[Label] = []
         for i in range(16):
             label = Label(f"Stack {i}")
-            label.setStyleSheet(
-                "background-color: white; color: #1E1E1E; padding: 5px; border: 1px solid #DDDDDD;"
-            )
+            label.setObjectName("panelLabel")
             label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.mem_locations.append(label)
             self.addWidget(self.mem_locations[i], (i / 2) + 1, i % 2)
@@ -2507,24 +2559,14 @@ class Stack(QGridLayout):
             else:
                 lsb = self.simulator.processor.memory[addr]
                 msb = self.simulator.processor.memory[addr + 1]
-                value = f"{msb:02X}{lsb:02X}H"
+                value = _HEX2[msb] + _HEX2[lsb] + "H"
             self.mem_locations[i * 2].setText(addr_label)
             self.mem_locations[i * 2 + 1].setText(value)
 
-    def zoom_in(self):
-        """Zoom in"""
-        for mem_location in self.mem_locations:
-            mem_location.zoom_in()
-
-    def zoom_out(self):
-        """Zoom out"""
-        for mem_location in self.mem_locations:
-            mem_location.zoom_out()
-
-    def reset_zoom(self):
-        """Reset zoom"""
+    def apply_zoom(self, zoom_level):
+        """Apply the shared zoom level to the stack labels"""
         for mem_location in self.mem_locations:
-            mem_location.reset_zoom()
+            mem_location.apply_zoom(zoom_level)
 
 
 class MemoryTableWidget(ZoomMixin, QTableWidget):
@@ -2585,6 +2627,16 @@ class MemoryTableWidget(ZoomMixin, QTableWidget):
         self.setEditTriggers(QTableWidget.NoEditTriggers)
         self.cellClicked.connect(self.display_value)
 
+        # Cells are created once and updated in place by load_memory_display
+        self.cells = []
+        for row in range(rows):
+            row_items = []
+            for col in range(columns):
+                item = QTableWidgetItem("")
+                self.setItem(row, col, item)
+                row_items.append(item)
+            self.cells.append(row_items)
+
     def display_value(self, row, column):
         if column >= 2:
             lsb_addr = int(self.item(row, 0).text()) + column - 2
@@ -2598,28 +2650,148 @@ class MemoryTableWidget(ZoomMixin, QTableWidget):
         self.clearSelection()
         super().focusOutEvent(event)
 
-    def zoom_in(self):
-        """Zoom in"""
-        super().zoom_in()
+    def apply_zoom(self, zoom_level):
+        """Apply the shared zoom level to the table and its header items"""
+        super().apply_zoom(zoom_level)
         for i in range(self.columnCount()):
-            self.horizontalHeaderItem(i).zoom_in()
+            self.horizontalHeaderItem(i).apply_zoom(zoom_level)
 
-    def zoom_out(self):
-        """Zoom out"""
-        super().zoom_out()
-        for i in range(self.columnCount()):
-            self.horizontalHeaderItem(i).zoom_out()
 
-    def reset_zoom(self):
-        """Reset zoom"""
-        super().reset_zoom()
-        for i in range(self.columnCount()):
-            self.horizontalHeaderItem(i).reset_zoom()
+# Status-label stylesheets, formatted once at import; set_status just
+# indexes the finished string for its status type
+_STATUS_BASE_STYLE = """
+    background-color: {bg_color};
+    color: #1E1E1E;
+    padding: 4px;
+    border: 1px solid #DDDDDD;
+    border-radius: 3px;
+"""
+_STATUS_STYLES = {
+    status_type: _STATUS_BASE_STYLE.format(bg_color=bg_color)
+    for status_type, bg_color in (
+        ("normal", "white"),  # White for normal/ready states
+        ("success", "#DFF6DD"),  # Light green for success/compile/run states
+        ("warning", "#FFF4CE"),  # Light yellow for warning/halt/pause states
+        ("error", "#FDE7E9"),  # Light red for error states
+    )
+}
+
+
+# Simulator-level styling, parsed once instead of per widget; the control
+# buttons and white panel labels opt in via object names
+_SIMULATOR_QSS = """
+    QWidget {
+        background-color: #EDEDED;
+        color: #1E1E1E;
+    }
+    QPushButton#assembleBtn {
+        background-color: #458ADB;
+        color: white;
+        border: none;
+        padding: 6px;
+    }
+    QPushButton#assembleBtn:hover {
+        background-color: #3A75C4;
+    }
+    QPushButton#stepBtn {
+        background-color: #B8A404;
+        color: white;
+        border: none;
+        padding: 6px;
+    }
+    QPushButton#stepBtn:hover {
+        background-color: #9E8C03;
+    }
+    QPushButton#runBtn {
+        background-color: #0DB000;
+        color: white;
+        border: none;
+        padding: 6px;
+    }
+    QPushButton#runBtn:hover {
+        background-color: #0A9000;
+    }
+    QPushButton#stopBtn {
+        background-color: #C42B1C;
+        color: white;
+        border: none;
+        padding: 6px;
+    }
+    QPushButton#stopBtn:hover {
+        background-color: #A82318;
+    }
+    QPushButton#resetBtn {
+        background-color: white;
+        color: #1E1E1E;
+        border: 2px solid #DDDDDD;
+        padding: 6px;
+    }
+    QPushButton#resetBtn:hover {
+        background-color: #F0F0F0;
+        border: 2px solid #BBBBBB;
+    }
+    QLabel#panelLabel {
+        background-color: white;
+        color: #1E1E1E;
+        padding: 5px;
+        border: 1px solid #DDDDDD;
+    }
+"""
+
+
+# Application-wide styling, parsed once by Qt instead of per-widget
+_GLOBAL_QSS = """
+    QScrollBar:vertical {
+        border: none;
+        background: #F0F0F0;
+        width: 10px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #AAAAAA;
+        min-height: 30px;
+        border-radius: 5px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #888888;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+        background: none;
+        border: none;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+    QScrollBar:horizontal {
+        border: none;
+        background: #F0F0F0;
+        height: 10px;
+        margin: 0px;
+    }
+    QScrollBar::handle:horizontal {
+        background: #AAAAAA;
+        min-width: 30px;
+        border-radius: 5px;
+    }
+    QScrollBar::handle:horizontal:hover {
+        background: #888888;
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0px;
+        background: none;
+        border: none;
+    }
+    QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+        background: none;
+    }
+"""
 
 
 def main():
     app = QApplication(sys.argv)
     app.setWindowIcon(QIcon(resource_path("8085-logo.ico")))
+    app.setStyleSheet(_GLOBAL_QSS)
 
     # Show splash screen
     splash_pix = QPixmap(resource_path("8085-splash-screen.png"))
@@ -14,6 +14,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import array
+
 
 class Processor8085:
     """
@@ -41,11 +43,15 @@ class Processor8085:
         self.error = None
         self.last_instruction = None
         self.program_end_address = 0
-        self.program_memory_range = set()
-        self.data_memory_range = set()
+        self.program_memory_flags = bytearray(0x10000)
+        self.data_memory_flags = bytearray(0x10000)
         self.parsed_program = []
+        # Per-address instruction index built by load_program for O(1) fetch
+        self._program_index = {}
         self.line_to_address_map = {}
-        self.address_to_line_map = {}
+        # Flat per-address line table (-1 = no source line), matching the
+        # array the assembler produces
+        self.address_to_line_map = array.array("i", [-1]) * 0x10000
         self.labels = {}
         self.symbols = {}
 
@@ -59,13 +65,21 @@ class Processor8085:
         # Copy all needed data from assembly output
         self.memory = assembly_output.memory
         self.parsed_program = assembly_output.parsed_program
+        # Index instructions by address so step() fetches in O(1) instead of
+        # scanning the program list; the entry also carries the upper-cased
+        # opcode and display text so neither is re-derived per step
+        self._program_index = {
+            addr: (tokens, tokens[0].upper(), " ".join(tokens))
+            for addr, tokens in self.parsed_program
+            if tokens
+        }
         self.line_to_address_map = assembly_output.line_to_address_map
         self.address_to_line_map = assembly_output.address_to_line_map
         self.labels = assembly_output.labels
         self.symbols = assembly_output.symbols
         self.program_end_address = assembly_output.program_end_address
-        self.program_memory_range = assembly_output.program_memory_range
-        self.data_memory_range = assembly_output.data_memory_range
+        self.program_memory_flags = assembly_output.program_memory_flags
+        self.data_memory_flags = assembly_output.data_memory_flags
 
         # Set processor state for execution
         self.registers["PC"] = assembly_output.starting_address
@@ -149,19 +163,13 @@ class Processor8085:
 
         pc = self.registers["PC"]
 
-        # Find instruction at current PC
-        instruction = None
-        for addr, tokens in self.parsed_program:
-            if addr == pc:
-                instruction = tokens
-                break
-
-        if not instruction:
+        # Fetch instruction at current PC from the per-address index
+        entry = self._program_index.get(pc)
+        if entry is None:
             self.error = f"No instruction at address {pc:04X}"
             return "ERROR"
 
-        self.last_instruction = " ".join(instruction)
-        opcode = instruction[0].upper()
+        instruction, opcode, self.last_instruction = entry
 
         try:
             # Process jump instructions with label support
@@ -1290,4 +1298,11 @@ class Processor8085:
 
     def is_program_memory(self, address):
         """Returns True if the address contains program code (not data)"""
-        return address in self.program_memory_range and address not in self.data_memory_range
+        return bool(self.program_memory_flags[address]) and not self.data_memory_flags[address]
+
+    def program_memory_bounds(self):
+        """Returns the (start, end) addresses of program code, or (0, 0) if none"""
+        start = self.program_memory_flags.find(1)
+        if start == -1:
+            return 0, 0
+        return start, self.program_memory_flags.rfind(1)